@@ -0,0 +1,406 @@
+"""벤치마크용 DynamoDB 대체 구현 (dict 기반, 프로세스 내)
+
+핸들러가 쓰는 호출만 지원한다: get/put/update/delete_item, query, scan,
+batch_get_item, batch_write_item. 키/조건/필터/갱신 식은 문자열 식만 파싱한다.
+테이블별 호출 수와 읽은 항목 수(get 1건, query/scan은 ScannedCount)를 집계한다.
+"""
+import bisect
+import copy
+import re
+from decimal import Decimal
+
+# 실제 DynamoDB의 1MB 페이지 제한을 항목 수로 근사
+PAGE_ITEMS = 1000
+
+
+class ClientError(Exception):
+    """botocore ClientError와 같은 response 형태의 에러"""
+
+    def __init__(self, code: str, message: str = ''):
+        super().__init__(f'{code}: {message}')
+        self.response = {'Error': {'Code': code, 'Message': message}}
+
+
+# ==========================================
+# 식 파싱
+# ==========================================
+
+TOKEN = re.compile(
+    r"\s*(attribute_not_exists|attribute_exists|begins_with|AND|OR|NOT"
+    r"|[#:]?[A-Za-z_][A-Za-z0-9_]*|<>|<=|>=|=|<|>|\(|\)|,)"
+)
+
+
+def tokenize(expr: str) -> list:
+    tokens, pos, expr = [], 0, expr.strip()
+    while pos < len(expr):
+        match = TOKEN.match(expr, pos)
+        if not match:
+            raise ClientError('ValidationException', f'Invalid expression: {expr!r}')
+        tokens.append(match.group(1))
+        pos = match.end()
+        while pos < len(expr) and expr[pos] == ' ':
+            pos += 1
+    return tokens
+
+
+class Condition:
+    """조건 식 평가기 (비교, AND/OR/NOT, 괄호, attribute_exists, begins_with)"""
+
+    def __init__(self, expr: str, names: dict = None, values: dict = None):
+        self.tokens = tokenize(expr)
+        self.names = names or {}
+        self.values = values or {}
+
+    def __call__(self, item: dict) -> bool:
+        self.pos = 0
+        return self._or(item)
+
+    def _peek(self):
+        return self.tokens[self.pos] if self.pos < len(self.tokens) else None
+
+    def _take(self):
+        token = self.tokens[self.pos]
+        self.pos += 1
+        return token
+
+    def _operand(self, item):
+        token = self._take()
+        if token.startswith(':'):
+            return self.values[token]
+        return item.get(self.names.get(token, token))
+
+    def _or(self, item):
+        result = self._and(item)
+        while self._peek() == 'OR':
+            self._take()
+            result = self._and(item) or result
+        return result
+
+    def _and(self, item):
+        result = self._atom(item)
+        while self._peek() == 'AND':
+            self._take()
+            result = self._atom(item) and result
+        return result
+
+    def _atom(self, item):
+        token = self._peek()
+        if token == 'NOT':
+            self._take()
+            return not self._atom(item)
+        if token == '(':
+            self._take()
+            result = self._or(item)
+            self._take()
+            return result
+        if token in ('attribute_exists', 'attribute_not_exists', 'begins_with'):
+            self._take()
+            self._take()  # (
+            name = self._take()
+            name = self.names.get(name, name)
+            if token == 'begins_with':
+                self._take()  # ,
+                prefix = self._operand(item)
+                self._take()  # )
+                value = item.get(name)
+                return isinstance(value, str) and value.startswith(prefix)
+            self._take()  # )
+            return (name in item) == (token == 'attribute_exists')
+
+        left = self._operand(item)
+        op = self._take()
+        right = self._operand(item)
+        if op == '=':
+            return left == right
+        if op == '<>':
+            return left != right
+        if left is None or right is None:
+            return False
+        return {'<': left < right, '<=': left <= right, '>': left > right, '>=': left >= right}[op]
+
+
+def key_equality(expr: str, names: dict, values: dict, attribute: str):
+    """키 조건 식에서 attribute = :value 형태의 값 추출"""
+    tokens = tokenize(expr)
+    for i in range(len(tokens) - 2):
+        name, op, value = tokens[i:i + 3]
+        if op == '=' and names.get(name, name) == attribute and value.startswith(':'):
+            return values[value]
+    raise ClientError('ValidationException', f'Query condition missed key schema element: {attribute}')
+
+
+def split_clauses(text: str) -> list:
+    """괄호 밖의 쉼표로 분리"""
+    parts, depth, current = [], 0, ''
+    for ch in text:
+        depth += ch == '('
+        depth -= ch == ')'
+        if ch == ',' and depth == 0:
+            parts.append(current)
+            current = ''
+        else:
+            current += ch
+    if current.strip():
+        parts.append(current)
+    return [part.strip() for part in parts]
+
+
+def apply_update(item: dict, expr: str, names: dict, values: dict) -> None:
+    """갱신 식 적용 (SET a = :v, ADD a :n, REMOVE a)"""
+    action = None
+    for part in re.split(r'\b(SET|ADD|REMOVE)\b', expr):
+        part = part.strip()
+        if part in ('SET', 'ADD', 'REMOVE'):
+            action = part
+            continue
+        for clause in split_clauses(part) if part else []:
+            if action == 'SET':
+                name, value = [x.strip() for x in clause.split('=', 1)]
+                item[names.get(name, name)] = copy.deepcopy(values[value])
+            elif action == 'ADD':
+                name, value = clause.split()
+                name = names.get(name, name)
+                if isinstance(values[value], set):
+                    item[name] = set(item.get(name, set())) | values[value]
+                else:
+                    item[name] = item.get(name, 0) + values[value]
+            elif action == 'REMOVE':
+                item.pop(names.get(clause, clause), None)
+
+
+def to_dynamo(value):
+    """boto3처럼 숫자를 Decimal로 저장"""
+    if isinstance(value, bool):
+        return value
+    if isinstance(value, (int, float)):
+        return Decimal(str(value))
+    if isinstance(value, dict):
+        return {k: to_dynamo(v) for k, v in value.items()}
+    if isinstance(value, list):
+        return [to_dynamo(v) for v in value]
+    return value
+
+
+# ==========================================
+# 테이블 / 리소스
+# ==========================================
+
+class FakeTable:
+    """dict 기반 테이블 (GSI는 {이름: (파티션 키, 정렬 키)})"""
+
+    def __init__(self, name: str, hash_key: str = 'pk', range_key: str = None, indexes: dict = None):
+        self.name = name
+        self.hash_key = hash_key
+        self.range_key = range_key
+        self.indexes = indexes or {}
+        self.items = {}
+        self.calls = {}
+        self.items_read = 0
+        self._version = 0
+        self._views = {}
+
+    # 내부 -----------------------------------------------------------
+
+    def _key(self, key: dict) -> tuple:
+        return (key[self.hash_key], key.get(self.range_key) if self.range_key else None)
+
+    def _key_dict(self, item: dict) -> dict:
+        key = {self.hash_key: item[self.hash_key]}
+        if self.range_key:
+            key[self.range_key] = item[self.range_key]
+        return key
+
+    def _count(self, op: str, read: int = 0) -> None:
+        self.calls[op] = self.calls.get(op, 0) + 1
+        self.items_read += read
+
+    def _write(self, key: tuple, item: dict = None) -> None:
+        if item is None:
+            self.items.pop(key, None)
+        else:
+            self.items[key] = item
+        self._version += 1
+
+    def _view(self, name: str, build):
+        """쓰기 전까지 재사용하는 정렬/위치 캐시"""
+        view = self._views.get(name)
+        if view is None or view[0] != self._version:
+            view = self._views[name] = (self._version, build())
+        return view[1]
+
+    def _partitions(self, hash_key: str, range_key: str) -> dict:
+        def build():
+            groups = {}
+            for key, item in self.items.items():
+                if hash_key in item and (range_key is None or range_key in item):
+                    sort = (item[range_key] if range_key else '', key)
+                    groups.setdefault(item[hash_key], []).append((sort, item))
+            for rows in groups.values():
+                rows.sort(key=lambda row: row[0])
+            return {value: ([row[0] for row in rows], [row[1] for row in rows]) for value, rows in groups.items()}
+        return self._view(('partitions', hash_key, range_key), build)
+
+    def seed(self, items: list) -> None:
+        """조건 검사/호출 집계 없이 대량 적재"""
+        for item in items:
+            self.items[self._key(item)] = to_dynamo(item)
+        self._version += 1
+
+    def reset_counters(self) -> None:
+        self.calls = {}
+        self.items_read = 0
+
+    # 단건 -----------------------------------------------------------
+
+    def get_item(self, Key, ConsistentRead=False, **kwargs):
+        item = self.items.get(self._key(Key))
+        self._count('get_item', 1 if item else 0)
+        return {'Item': copy.deepcopy(item)} if item else {}
+
+    def put_item(self, Item, ConditionExpression=None, ExpressionAttributeNames=None,
+                 ExpressionAttributeValues=None, **kwargs):
+        self._count('put_item')
+        for hash_key, range_key in self.indexes.values():
+            if any(name and Item.get(name) == '' for name in (hash_key, range_key)):
+                raise ClientError('ValidationException', 'One or more parameter values are not valid')
+        key = self._key(Item)
+        if ConditionExpression:
+            condition = Condition(ConditionExpression, ExpressionAttributeNames, to_dynamo(ExpressionAttributeValues))
+            if not condition(self.items.get(key, {})):
+                raise ClientError('ConditionalCheckFailedException', 'The conditional request failed')
+        self._write(key, to_dynamo(copy.deepcopy(Item)))
+        return {}
+
+    def update_item(self, Key, UpdateExpression, ConditionExpression=None, ExpressionAttributeNames=None,
+                    ExpressionAttributeValues=None, ReturnValues=None, **kwargs):
+        self._count('update_item')
+        key = self._key(Key)
+        names, values = ExpressionAttributeNames or {}, to_dynamo(ExpressionAttributeValues or {})
+        current = self.items.get(key, {})
+        if ConditionExpression and not Condition(ConditionExpression, names, values)(current):
+            raise ClientError('ConditionalCheckFailedException', 'The conditional request failed')
+        item = copy.deepcopy(current) or dict(Key)
+        apply_update(item, UpdateExpression, names, values)
+        self._write(key, item)
+        return {'Attributes': copy.deepcopy(item)} if ReturnValues and ReturnValues != 'NONE' else {}
+
+    def delete_item(self, Key, ReturnValues=None, **kwargs):
+        self._count('delete_item')
+        old = self.items.get(self._key(Key))
+        self._write(self._key(Key))
+        return {'Attributes': copy.deepcopy(old)} if old and ReturnValues == 'ALL_OLD' else {}
+
+    # 목록 -----------------------------------------------------------
+
+    def scan(self, FilterExpression=None, ExpressionAttributeNames=None, ExpressionAttributeValues=None,
+             Limit=None, ExclusiveStartKey=None, ProjectionExpression=None, **kwargs):
+        keys = self._view('scan_keys', lambda: list(self.items))
+        start = 0
+        if ExclusiveStartKey:
+            positions = self._view('scan_positions', lambda: {key: i for i, key in enumerate(keys)})
+            start = positions[self._key(ExclusiveStartKey)] + 1
+        page = keys[start:start + min(Limit or PAGE_ITEMS, PAGE_ITEMS)]
+
+        condition = FilterExpression and Condition(
+            FilterExpression, ExpressionAttributeNames, to_dynamo(ExpressionAttributeValues))
+        rows = [self.items[key] for key in page]
+        matched = [copy.deepcopy(row) for row in rows if not condition or condition(row)]
+        self._count('scan', len(rows))
+
+        response = {'Items': matched, 'Count': len(matched), 'ScannedCount': len(rows)}
+        if start + len(page) < len(keys):
+            response['LastEvaluatedKey'] = self._key_dict(rows[-1])
+        return response
+
+    def query(self, KeyConditionExpression, IndexName=None, FilterExpression=None,
+              ExpressionAttributeNames=None, ExpressionAttributeValues=None, Limit=None,
+              ExclusiveStartKey=None, ScanIndexForward=True, ProjectionExpression=None, **kwargs):
+        if not isinstance(KeyConditionExpression, str):
+            raise TypeError('FakeTable only supports string key condition expressions')
+        if IndexName:
+            if IndexName not in self.indexes:
+                raise ClientError('ValidationException', f'The table does not have the specified index: {IndexName}')
+            hash_key, range_key = self.indexes[IndexName]
+        else:
+            hash_key, range_key = self.hash_key, self.range_key
+
+        names, values = ExpressionAttributeNames or {}, to_dynamo(ExpressionAttributeValues or {})
+        sorts, rows = self._partitions(hash_key, range_key).get(
+            key_equality(KeyConditionExpression, names, values, hash_key), ([], []))
+        start = 0
+        if ExclusiveStartKey:
+            last = (ExclusiveStartKey[range_key] if range_key else '', self._key(ExclusiveStartKey))
+            start = bisect.bisect_right(sorts, last) if ScanIndexForward else len(sorts) - bisect.bisect_left(sorts, last)
+        if not ScanIndexForward:
+            rows = rows[::-1]
+
+        key_condition = Condition(KeyConditionExpression, names, values)
+        condition = FilterExpression and Condition(FilterExpression, names, values)
+        page_size = min(Limit or PAGE_ITEMS, PAGE_ITEMS)
+        evaluated, matched, position = [], [], start
+        while position < len(rows) and len(evaluated) < page_size:
+            row = rows[position]
+            position += 1
+            if not key_condition(row):
+                if evaluated:
+                    position = len(rows)  # 정렬키 범위 조건은 연속 구간이므로 벗어나면 끝
+                    break
+                continue
+            evaluated.append(row)
+            if not condition or condition(row):
+                matched.append(copy.deepcopy(row))
+        self._count('query', len(evaluated))
+
+        response = {'Items': matched, 'Count': len(matched), 'ScannedCount': len(evaluated)}
+        if evaluated and position < len(rows):
+            last = self._key_dict(evaluated[-1])
+            last[hash_key] = evaluated[-1][hash_key]
+            if range_key:
+                last[range_key] = evaluated[-1][range_key]
+            response['LastEvaluatedKey'] = last
+        return response
+
+
+class FakeDynamoDB:
+    """boto3 DynamoDB 리소스 대체 (Table, batch_get_item, batch_write_item)"""
+
+    def __init__(self):
+        self.tables = {}
+
+    def add_table(self, table: FakeTable) -> FakeTable:
+        self.tables[table.name] = table
+        return table
+
+    def Table(self, name: str) -> FakeTable:
+        if name not in self.tables:
+            self.tables[name] = FakeTable(name)
+        return self.tables[name]
+
+    def batch_get_item(self, RequestItems, **kwargs):
+        responses = {}
+        for name, spec in RequestItems.items():
+            table = self.Table(name)
+            found = [table.items[table._key(key)] for key in spec['Keys'] if table._key(key) in table.items]
+            table._count('batch_get_item', len(found))
+            responses[name] = [copy.deepcopy(item) for item in found]
+        return {'Responses': responses, 'UnprocessedKeys': {}}
+
+    def batch_write_item(self, RequestItems, **kwargs):
+        for name, requests in RequestItems.items():
+            table = self.Table(name)
+            table._count('batch_write_item')
+            for request in requests:
+                if 'PutRequest' in request:
+                    item = request['PutRequest']['Item']
+                    table._write(table._key(item), to_dynamo(copy.deepcopy(item)))
+                else:
+                    table._write(table._key(request['DeleteRequest']['Key']))
+        return {'UnprocessedItems': {}}
+
+    def reset_counters(self) -> None:
+        for table in self.tables.values():
+            table.reset_counters()
+
+    def items_read(self) -> int:
+        return sum(table.items_read for table in self.tables.values())
@@ -0,0 +1,132 @@
+"""벤치마크용 로컬 HTTP 서버 (RSS 피드 + Claude Messages API 대체)
+
+GET  /feeds/<name>.xml  - 요청마다 새 기사(링크, 발행 시각 증가)가 포함된 RSS (ETag 없음, 매번 200)
+                          DUPLICATE_EVERY번째 기사마다 직전 기사를 제목만 조금 바꿔 다시 실음 (유사 기사 묶기용)
+POST /v1/messages       - 프롬프트의 [기사 N] 개수만큼 분석 결과 JSON 배열 반환,
+                          기사 구분이 없으면 단건 분석 JSON 반환
+지연 시간은 FakeServices.feed_latency / claude_latency (초)로 조절한다.
+"""
+import itertools
+import json
+import random
+import re
+import threading
+import time
+from email.utils import formatdate
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+ITEMS_PER_FEED = 5
+DUPLICATE_EVERY = 4
+VOCABULARY = (
+    'model agent chip robot policy regulation startup funding compute datacenter benchmark safety '
+    'reasoning vision speech translation search cloud energy battery semiconductor memory training '
+    'inference opensource license lawsuit copyright privacy election education healthcare drug protein '
+    'climate weather satellite quantum network security malware browser smartphone laptop factory '
+    'logistics finance insurance banking market investor acquisition partnership government parliament '
+    'military defense university research laboratory dataset token context multimodal video music art'
+).split()
+ANALYSIS = {
+    'summary': '벤치마크 요약',
+    'ai_analysis': '벤치마크 분석',
+    'ai_comment': '벤치마크 코멘트',
+    'ai_perspective': 'Science'
+}
+
+
+def story(n: int) -> tuple:
+    """n번째 기사의 (제목, 설명) - 기사마다 다른 단어 조합, DUPLICATE_EVERY번째는 직전 기사의 재보도"""
+    if n % DUPLICATE_EVERY == DUPLICATE_EVERY - 1:
+        title, description = story(n - 1)
+        return 'Report: ' + title, description
+    rng = random.Random(n)
+    # 어휘만으로는 기사끼리 겹치는 단어가 많아 기사마다 고유한 고유명사 몇 개를 섞음
+    words = rng.sample(VOCABULARY, 12) + ['name%05d' % rng.randrange(100000) for _ in range(12)]
+    rng.shuffle(words)
+    return ' '.join(words[:8]).capitalize(), ' '.join(words[8:]).capitalize() + '.'
+
+
+class FakeServices:
+    """백그라운드 스레드에서 동작하는 로컬 서버"""
+
+    def __init__(self, feed_latency: float = 0.0, claude_latency: float = 0.0):
+        self.feed_latency = feed_latency
+        self.claude_latency = claude_latency
+        self.feed_requests = 0
+        self.claude_requests = 0
+        self._sequence = itertools.count()
+        self._started = int(time.time()) - 86400
+        self._lock = threading.Lock()
+        self._server = ThreadingHTTPServer(('127.0.0.1', 0), self._handler_class())
+        self._server.daemon_threads = True
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+
+    @property
+    def base_url(self) -> str:
+        return 'http://127.0.0.1:%d' % self._server.server_port
+
+    def start(self) -> 'FakeServices':
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        self._server.shutdown()
+        self._server.server_close()
+
+    def feed_url(self, name: str) -> str:
+        return f'{self.base_url}/feeds/{name}.xml'
+
+    def render_feed(self, name: str) -> bytes:
+        """요청마다 다른 링크의 기사를 생성해 수집 중복 제거에 걸리지 않게 함"""
+        with self._lock:
+            self.feed_requests += 1
+            start = next(self._sequence) * ITEMS_PER_FEED
+        # 발행 시각도 요청마다 증가시켜 last_seen_pub 이후 기사로 인식되게 함
+        items = ''.join(
+            f'<item><title>{title}</title>'
+            f'<link>https://bench.example.com/{name}/{n}</link>'
+            f'<description>{description}</description>'
+            f'<pubDate>{formatdate(self._started + n, usegmt=True)}</pubDate></item>'
+            for n, (title, description) in ((n, story(n)) for n in range(start, start + ITEMS_PER_FEED))
+        )
+        return f'<?xml version="1.0"?><rss><channel><title>{name}</title>{items}</channel></rss>'.encode('utf-8')
+
+    def render_message(self, request: dict) -> bytes:
+        with self._lock:
+            self.claude_requests += 1
+        prompt = request['messages'][0]['content']
+        count = len(re.findall(r'^\[기사 \d+\]', prompt, re.MULTILINE))
+        if count:
+            text = json.dumps([{'index': i, **ANALYSIS} for i in range(count)], ensure_ascii=False)
+        else:
+            text = json.dumps(ANALYSIS, ensure_ascii=False)
+        return json.dumps({'content': [{'type': 'text', 'text': text}]}).encode('utf-8')
+
+    def _handler_class(self):
+        services = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def log_message(self, *args):
+                pass
+
+            def _send(self, status: int, body: bytes, content_type: str) -> None:
+                self.send_response(status)
+                self.send_header('Content-Type', content_type)
+                self.send_header('Content-Length', str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def do_GET(self):
+                match = re.match(r'^/feeds/([\w-]+)\.xml$', self.path)
+                if not match:
+                    return self._send(404, b'not found', 'text/plain')
+                time.sleep(services.feed_latency)
+                self._send(200, services.render_feed(match.group(1)), 'application/rss+xml')
+
+            def do_POST(self):
+                if self.path != '/v1/messages':
+                    return self._send(404, b'not found', 'text/plain')
+                request = json.loads(self.rfile.read(int(self.headers['Content-Length'])))
+                time.sleep(services.claude_latency)
+                self._send(200, services.render_message(request), 'application/json')
+
+        return Handler
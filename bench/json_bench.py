@@ -0,0 +1,96 @@
+"""JSON 직렬화 마이크로벤치마크
+
+DynamoDB에서 읽은 형태(숫자는 Decimal)의 뉴스 항목 N개를 응답 본문으로 직렬화하는 비용을
+기존 방식(json.dumps + DecimalEncoder)과 현재 방식(읽을 때 NUMBER_FIELDS 필드만 변환 + dumps_json)으로 비교한다.
+
+    python bench/json_bench.py                  # 10k 항목, 20회 반복
+    python bench/json_bench.py --items 1000 --runs 100
+"""
+import argparse
+import copy
+import json
+import os
+import statistics
+import sys
+import time
+from decimal import Decimal
+
+BENCH_DIR = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.join(BENCH_DIR, '..', 'handlers'))
+
+import aiatlas_handler as h  # noqa: E402
+
+
+class DecimalEncoder(json.JSONEncoder):
+    """변경 전 핸들러의 인코더 (비교 기준)"""
+
+    def default(self, obj):
+        if isinstance(obj, Decimal):
+            return float(obj) if obj % 1 else int(obj)
+        return super().default(obj)
+
+
+def build_items(count: int) -> list:
+    """boto3가 돌려주는 형태의 뉴스 항목 (숫자 필드는 Decimal)"""
+    items = []
+    for i in range(count):
+        item = h.build_news_item({
+            'title': f'벤치마크 기사 {i} - AI 모델과 컴퓨팅',
+            'url': f'https://bench.example.com/news/{i}',
+            'source': 'bench',
+            'summary': '요약 ' * 20,
+            'ai_analysis': '분석 ' * 40,
+            'ai_comment': '코멘트 ' * 10
+        })
+        # 게시된 뉴스 항목의 숫자 필드 (boto3는 Decimal로 반환)
+        item['attempts'] = Decimal(i % 3)
+        item['published_at'] = item['created_at']
+        items.append(item)
+    return items
+
+
+def old_path(items: list) -> str:
+    return json.dumps({'success': True, 'news': items}, ensure_ascii=False, cls=DecimalEncoder)
+
+
+def new_path(items: list) -> str:
+    fields = h.NUMBER_FIELDS[h.TABLE_NEWS]
+    for item in items:
+        h.convert_fields(item, fields)
+    return h.dumps_json({'success': True, 'news': items})
+
+
+def timed(fn, count: int, runs: int) -> list:
+    samples = []
+    for _ in range(runs):
+        items = build_items(count)  # 변환은 제자리에서 일어나므로 매번 새 항목 사용
+        started = time.perf_counter()
+        fn(items)
+        samples.append((time.perf_counter() - started) * 1000)
+    return samples
+
+
+def main():
+    parser = argparse.ArgumentParser(description='AI Atlas JSON serialization benchmark')
+    parser.add_argument('--items', type=int, default=10000, help='응답에 담을 항목 수 (기본: 10000)')
+    parser.add_argument('--runs', type=int, default=20, help='반복 횟수')
+    args = parser.parse_args()
+
+    items = build_items(args.items)
+    assert json.loads(old_path(items)) == json.loads(new_path(copy.deepcopy(items))), 'outputs differ'
+
+    encoder = 'orjson' if h.orjson is not None else 'json (stdlib)'
+    rows = [
+        ('json.dumps + DecimalEncoder', timed(old_path, args.items, args.runs)),
+        (f'convert_fields + {encoder}', timed(new_path, args.items, args.runs)),
+    ]
+    baseline = statistics.median(rows[0][1])
+    print(f"{args.items} items, {args.runs} runs")
+    print(f"{'path':<34} {'median ms':>10} {'min ms':>9} {'speedup':>8}")
+    for name, samples in rows:
+        median = statistics.median(samples)
+        print(f"{name:<34} {median:>10.2f} {min(samples):>9.2f} {baseline / median:>7.1f}x")
+
+
+if __name__ == '__main__':
+    main()
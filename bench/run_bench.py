@@ -0,0 +1,275 @@
+"""핸들러 로컬 벤치마크
+
+dict 기반 DynamoDB 대체 구현과 로컬 RSS / Claude 서버로 handler()를 호출해
+엔드포인트별 처리량, p50/p99 지연 시간, 요청당 DynamoDB 호출 수와 읽은 항목 수,
+응답 본문 크기를 출력한다.
+
+    python bench/run_bench.py                         # 1k / 10k 항목
+    python bench/run_bench.py --sizes 100000 --requests 50
+    python bench/run_bench.py --no-index              # GSI 없는 배포 (scan 폴백 경로)
+    python bench/run_bench.py --no-cache --claude-latency 0.5 --json result.json
+"""
+import argparse
+import base64
+import gzip
+import json
+import os
+import sys
+import tempfile
+import time
+from datetime import datetime, timedelta
+
+BENCH_DIR = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, BENCH_DIR)
+sys.path.insert(0, os.path.join(BENCH_DIR, '..', 'handlers'))
+
+from fake_dynamodb import FakeDynamoDB, FakeTable  # noqa: E402
+from fake_services import FakeServices  # noqa: E402
+
+ACCEPT_ENCODING = 'gzip, deflate, br'
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description='AI Atlas handler benchmark')
+    parser.add_argument('--sizes', type=int, nargs='+', default=[1000, 10000],
+                        help='news / events 테이블에 넣을 항목 수 (기본: 1000 10000)')
+    parser.add_argument('--requests', type=int, default=200, help='조회 엔드포인트별 요청 수')
+    parser.add_argument('--collect-runs', type=int, default=3, help='/news/collect, /news/analyze 실행 횟수')
+    parser.add_argument('--feeds', type=int, default=8, help='수집 대상 RSS 피드 수')
+    parser.add_argument('--feed-latency', type=float, default=0.05, help='RSS 응답 지연 (초)')
+    parser.add_argument('--claude-latency', type=float, default=0.2, help='Claude 응답 지연 (초)')
+    parser.add_argument('--claude-rpm', type=float, default=6000,
+                        help='Claude 분당 요청 제한 (기본: 사실상 제한 없음, 운영 값 재현 시 50 등)')
+    parser.add_argument('--no-index', action='store_true', help='상태별 GSI 없이 실행 (scan 폴백)')
+    parser.add_argument('--accept-encoding', default='gzip, deflate, br',
+                        help="조회 요청의 Accept-Encoding (압축 없이 측정하려면 '')")
+    parser.add_argument('--no-cache', action='store_true', help='컨테이너 응답 캐시 비활성화')
+    parser.add_argument('--json', metavar='PATH', help='결과를 JSON 파일로 저장')
+    return parser.parse_args()
+
+
+def configure_env(args, services: FakeServices) -> None:
+    """핸들러 import 전에 환경 변수로 외부 의존성을 로컬 대체 구현으로 연결"""
+    sources = {
+        'sources': [
+            {'name': f'bench-{i}', 'rss': services.feed_url(f'bench-{i}'), 'category': 'science', 'priority': 'high'}
+            for i in range(args.feeds)
+        ]
+    }
+    path = os.path.join(tempfile.mkdtemp(prefix='aiatlas-bench-'), 'news_sources.json')
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump(sources, f)
+
+    os.environ.update({
+        'ANTHROPIC_API_KEY': 'bench',
+        'ANTHROPIC_API_URL': services.base_url + '/v1/messages',
+        'AIATLAS_NEWS_SOURCES_PATH': path,
+        'AIATLAS_LLM_CACHE_BACKEND': 'none',
+        'AIATLAS_METRICS_SAMPLE_RATE': '0',
+        'AIATLAS_CLAUDE_RPM': str(args.claude_rpm),
+        'AIATLAS_CLAUDE_BURST': str(max(1, int(args.claude_rpm // 60))),
+    })
+    if args.no_cache:
+        os.environ['AIATLAS_RESPONSE_CACHE_TTL'] = '0'
+
+
+def build_database(h, size: int, with_index: bool) -> FakeDynamoDB:
+    """news / events 테이블을 size개씩 채운 DynamoDB 대체 구현"""
+    db = FakeDynamoDB()
+    news = db.add_table(FakeTable(h.TABLE_NEWS, indexes={
+        h.NEWS_STATUS_INDEX: ('status', 'created_at'),
+        h.NEWS_CATEGORY_INDEX: ('pub_category', 'created_at'),
+        h.NEWS_PERSPECTIVE_INDEX: ('pub_perspective', 'created_at'),
+        h.NEWS_TOPIC_INDEX: ('pub_topic', 'created_at'),
+    } if with_index else {}))
+    events = db.add_table(FakeTable(h.TABLE_EVENTS, indexes={h.EVENTS_STATUS_INDEX: ('status', 'date')} if with_index else {}))
+    db.add_table(FakeTable(h.TABLE_CONFIG))
+    db.add_table(FakeTable(h.TABLE_LLM_CACHE))
+    db.add_table(FakeTable(h.TABLE_SEARCH, range_key='sk'))
+
+    base = datetime(2024, 1, 1)
+    categories = list(h.NEWS_CATEGORIES)
+    news_items, event_items = [], []
+    for i in range(size):
+        item = h.build_news_item({
+            'title': f'Seed article {i}',
+            'url': f'https://seed.example.com/news/{i}',
+            'source': 'seed',
+            'category': categories[i % len(categories)],
+            'ai_perspective': h.NEWS_PERSPECTIVES[i % len(h.NEWS_PERSPECTIVES)],
+            'summary': 'seed summary',
+            'ai_analysis': 'seed analysis',
+            'ai_comment': 'seed comment'
+        })
+        item['created_at'] = (base + timedelta(minutes=i)).isoformat()
+        news_items.append(item)
+        event = h.build_event_item(f'event_seed_{i:06d}', {
+            'title': f'Seed event {i}',
+            'date': (base + timedelta(hours=i)).strftime('%Y-%m-%d %H:%M'),
+            'what_changed': 'seed'
+        })
+        event['created_at'] = (base + timedelta(minutes=i, seconds=30)).isoformat()
+        event_items.append(event)
+    news.seed(news_items)
+    events.seed(event_items)
+    return db
+
+
+def attach_database(h, db: FakeDynamoDB) -> None:
+    """핸들러의 DynamoDB 리소스와 컨테이너 캐시를 교체"""
+    h._dynamodb = h.InstrumentedDynamo(db)
+    h._tables.clear()
+    h._response_cache.clear()
+    h._content_version.update(value=None, checked_at=0.0)
+    h._missing_indexes.clear()
+    h._search_cache.clear()
+    for view_key in h.MATERIALIZED_VIEWS:
+        h.rebuild_materialized(view_key)
+    h.rebuild_search_index()
+
+
+def api_event(method: str, path: str, query: dict = None, headers: dict = None) -> dict:
+    return {
+        'httpMethod': method,
+        'path': '/v1/aiatlas' + path,
+        'queryStringParameters': query,
+        'headers': {'Accept-Encoding': ACCEPT_ENCODING, **(headers or {})},
+        'body': None
+    }
+
+
+def wire_bytes(response: dict) -> int:
+    """클라이언트가 받는 본문 크기 (base64 응답은 API Gateway가 디코딩한 크기)"""
+    body = response.get('body') or ''
+    if response.get('isBase64Encoded'):
+        return len(body) * 3 // 4
+    return len(body.encode('utf-8'))
+
+
+def response_json(response: dict) -> dict:
+    """압축 응답도 풀어서 JSON으로 파싱"""
+    body = response['body']
+    if response.get('isBase64Encoded'):
+        data = base64.b64decode(body)
+        if response['headers'].get('Content-Encoding') == 'gzip':
+            data = gzip.decompress(data)
+        elif response['headers'].get('Content-Encoding') == 'br':
+            import brotli
+            data = brotli.decompress(data)
+        body = data.decode('utf-8')
+    return json.loads(body)
+
+
+def percentile(samples: list, p: float) -> float:
+    ordered = sorted(samples)
+    return ordered[min(len(ordered) - 1, int(round(p / 100 * (len(ordered) - 1))))]
+
+
+def measure(h, db: FakeDynamoDB, name: str, event: dict, runs: int) -> dict:
+    """같은 요청을 runs번 실행한 지연 시간 / 처리량 / DynamoDB 읽기 집계"""
+    db.reset_counters()
+    latencies, statuses = [], {}
+    total_bytes = 0
+    started = time.perf_counter()
+    for _ in range(runs):
+        t0 = time.perf_counter()
+        response = h.handler(event, None)
+        latencies.append((time.perf_counter() - t0) * 1000)
+        total_bytes += wire_bytes(response)
+        statuses[response['statusCode']] = statuses.get(response['statusCode'], 0) + 1
+    elapsed = time.perf_counter() - started
+
+    calls = sum(sum(table.calls.values()) for table in db.tables.values())
+    return {
+        'endpoint': name,
+        'requests': runs,
+        'status': statuses,
+        'throughput_rps': round(runs / elapsed, 1),
+        'p50_ms': round(percentile(latencies, 50), 3),
+        'p99_ms': round(percentile(latencies, 99), 3),
+        'dynamodb_calls_per_request': round(calls / runs, 2),
+        'items_read_per_request': round(db.items_read() / runs, 1),
+        'bytes_per_response': total_bytes // runs
+    }
+
+
+def run_size(h, args, services: FakeServices, size: int) -> list:
+    db = build_database(h, size, with_index=not args.no_index)
+    attach_database(h, db)
+
+    token = h.generate_token(h.ADMIN_PASSWORD)
+    admin = {'Authorization': 'Bearer ' + token}
+
+    first_page = response_json(h.handler(api_event('GET', '/news', {'limit': '50'}), None))
+    recent = (datetime(2024, 1, 1) + timedelta(minutes=size - 20)).isoformat()  # 최근 20개만 해당
+    second_page_query = {'limit': '50', 'cursor': first_page['next_cursor']} if first_page.get('next_cursor') else {'limit': '50'}
+
+    read_endpoints = [
+        ('GET /news/latest', api_event('GET', '/news/latest')),
+        ('GET /news', api_event('GET', '/news', {'limit': '50'})),
+        ('GET /news (page 2)', api_event('GET', '/news', second_page_query)),
+        ('GET /events/public', api_event('GET', '/events/public')),
+        ('GET /events (admin)', api_event('GET', '/events', {'limit': '50'}, admin)),
+        ('GET /news?category', api_event('GET', '/news', {'limit': '50', 'category': 'economy'})),
+        ('GET /news?cat+persp', api_event('GET', '/news', {'limit': '50', 'category': 'economy',
+                                                            'perspective': 'Governance'})),
+        ('GET /news?since', api_event('GET', '/news', {'limit': '50', 'since': recent})),
+        ('GET /news/script', api_event('GET', '/news/script')),
+        ('GET /news/script?cat', api_event('GET', '/news/script', {'category': 'tech'})),
+        ('GET /search', api_event('GET', '/search', {'q': 'seed article'})),
+        ('GET /search (rare)', api_event('GET', '/search', {'q': f'article {size - 7}'})),
+        ('GET /roadmaps', api_event('GET', '/roadmaps')),
+    ]
+    results = [measure(h, db, name, event, args.requests) for name, event in read_endpoints]
+
+    # 수집(분석 대기 저장) 후 분석 작업자 실행
+    for name, path in (('POST /news/collect', '/news/collect'), ('POST /news/analyze', '/news/analyze')):
+        requests_before = (services.feed_requests, services.claude_requests)
+        result = measure(h, db, name, api_event('POST', path, headers=admin), args.collect_runs)
+        result['feed_requests'] = services.feed_requests - requests_before[0]
+        result['claude_requests'] = services.claude_requests - requests_before[1]
+        results.append(result)
+
+    for result in results:
+        result['size'] = size
+    return results
+
+
+def print_results(results: list) -> None:
+    header = (f"{'size':>7}  {'endpoint':<22} {'req':>5} {'rps':>9} {'p50 ms':>9} {'p99 ms':>9} "
+              f"{'ddb/req':>8} {'read/req':>9} {'bytes':>8}  status")
+    print(header)
+    print('-' * len(header))
+    for r in results:
+        print(f"{r['size']:>7}  {r['endpoint']:<22} {r['requests']:>5} {r['throughput_rps']:>9} "
+              f"{r['p50_ms']:>9} {r['p99_ms']:>9} {r['dynamodb_calls_per_request']:>8} "
+              f"{r['items_read_per_request']:>9} {r['bytes_per_response']:>8}  {r['status']}")
+
+
+def main():
+    global ACCEPT_ENCODING
+    args = parse_args()
+    ACCEPT_ENCODING = args.accept_encoding
+    services = FakeServices(feed_latency=args.feed_latency, claude_latency=args.claude_latency).start()
+    configure_env(args, services)
+    import aiatlas_handler as h
+
+    try:
+        results = []
+        for size in args.sizes:
+            results.extend(run_size(h, args, services, size))
+    finally:
+        services.stop()
+
+    print_results(results)
+    if args.json:
+        with open(args.json, 'w', encoding='utf-8') as f:
+            json.dump({
+                'generated_at': datetime.utcnow().isoformat(),
+                'options': vars(args),
+                'results': results
+            }, f, ensure_ascii=False, indent=2)
+
+
+if __name__ == '__main__':
+    main()
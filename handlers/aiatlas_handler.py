@@ -5,23 +5,104 @@ AI 문명 관측소 API
 경로: /v1/gendao/aiatlas/*
 """
 
+import time
+
+# 콜드 스타트 측정 기준 시각 (모듈 import 시작)
+_MODULE_LOAD_STARTED = time.perf_counter()
+
 import json
 import os
+import re
 import hashlib
-from datetime import datetime
+import base64
+import random
+import threading
+import unicodedata
+import uuid
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor, wait
+from contextlib import contextmanager
+from datetime import datetime, timedelta, timezone
 from decimal import Decimal
-import boto3
-from boto3.dynamodb.conditions import Key
+from urllib.parse import unquote
 
-# DynamoDB
-dynamodb = boto3.resource('dynamodb', region_name='ap-northeast-2')
+# DynamoDB (boto3는 최초 사용 시 로드)
+DYNAMODB_REGION = 'ap-northeast-2'
 TABLE_CONFIG = 'aiatlas_admin_config'
 TABLE_EVENTS = 'aiatlas_events'
 TABLE_ROADMAPS = 'aiatlas_roadmaps'
 TABLE_NEWS = 'aiatlas_news'
+TABLE_LLM_CACHE = 'aiatlas_llm_cache'
+TABLE_SEARCH = 'aiatlas_search'  # 검색 역색인 (PK: token, SK: created_at#문서 ID)
+
+# 상태별 최신순 조회용 GSI (PK: status, SK: created_at / date)
+# 인덱스가 없는 배포 환경에서는 기존 scan 경로로 폴백
+NEWS_STATUS_INDEX = os.environ.get('AIATLAS_NEWS_STATUS_INDEX', 'status-created_at-index')
+EVENTS_STATUS_INDEX = os.environ.get('AIATLAS_EVENTS_STATUS_INDEX', 'status-date-index')
+
+# 게시된 뉴스 필터용 sparse GSI (SK: created_at, PK 속성은 게시된 항목에만 존재)
+NEWS_CATEGORY_INDEX = os.environ.get('AIATLAS_NEWS_CATEGORY_INDEX', 'pub_category-created_at-index')
+NEWS_PERSPECTIVE_INDEX = os.environ.get('AIATLAS_NEWS_PERSPECTIVE_INDEX', 'pub_perspective-created_at-index')
+NEWS_TOPIC_INDEX = os.environ.get('AIATLAS_NEWS_TOPIC_INDEX', 'pub_topic-created_at-index')  # category#perspective
 
 # Claude API (뉴스 분석용)
 ANTHROPIC_API_KEY = os.environ.get('ANTHROPIC_API_KEY', '')
+ANTHROPIC_API_URL = os.environ.get('ANTHROPIC_API_URL', 'https://api.anthropic.com/v1/messages')
+CLAUDE_MODEL = 'claude-3-haiku-20240307'
+
+# Claude API 호출 제한 (API 티어에 맞춰 설정) / 재시도 / 회로 차단
+CLAUDE_REQUESTS_PER_MINUTE = float(os.environ.get('AIATLAS_CLAUDE_RPM', '50'))
+CLAUDE_BURST = int(os.environ.get('AIATLAS_CLAUDE_BURST', '5'))
+CLAUDE_MAX_RETRIES = int(os.environ.get('AIATLAS_CLAUDE_MAX_RETRIES', '2'))         # 429 / 5xx / 네트워크 오류
+CLAUDE_BREAKER_THRESHOLD = int(os.environ.get('AIATLAS_CLAUDE_BREAKER_THRESHOLD', '5'))  # 연속 실패 시 차단
+CLAUDE_BREAKER_COOLDOWN = float(os.environ.get('AIATLAS_CLAUDE_BREAKER_COOLDOWN', '60'))  # 차단 유지 시간 (초)
+
+# LLM 분석 캐시 (프로세스 내 LRU + 저장소: dynamodb | sqlite | none)
+LLM_CACHE_BACKEND = os.environ.get('AIATLAS_LLM_CACHE_BACKEND', 'dynamodb')
+LLM_CACHE_PATH = os.environ.get('AIATLAS_LLM_CACHE_PATH', '/tmp/aiatlas_llm_cache.sqlite3')
+LLM_CACHE_TTL = int(os.environ.get('AIATLAS_LLM_CACHE_TTL', str(7 * 24 * 3600)))
+LLM_CACHE_LRU_SIZE = int(os.environ.get('AIATLAS_LLM_CACHE_LRU_SIZE', '512'))
+
+# 뉴스 수집 파이프라인 (단계별 동시 실행 수, Lambda 남은 시간 기준 마감)
+FEED_FETCH_CONCURRENCY = int(os.environ.get('AIATLAS_FEED_CONCURRENCY', '8'))
+ANALYSIS_CONCURRENCY = int(os.environ.get('AIATLAS_ANALYSIS_CONCURRENCY', '4'))
+ANALYSIS_BATCH_SIZE = int(os.environ.get('AIATLAS_ANALYSIS_BATCH_SIZE', '4'))  # 1이면 기사별 단건 요청
+COLLECT_SAFETY_MARGIN = 5      # 저장/응답을 위해 남겨두는 시간 (초)
+DEFAULT_COLLECT_BUDGET = 120   # Lambda context가 없을 때의 시간 예산 (초)
+FEED_TIMEOUT = 10
+CLAUDE_TIMEOUT = 30
+
+# 분석 작업자 (수집 단계가 status=pending으로 저장한 기사를 상태 GSI로 꺼내 분석 후 published로 전환)
+ANALYSIS_WORKER_FUNCTION = os.environ.get('AIATLAS_ANALYSIS_WORKER_FUNCTION', '')  # 설정 시 수집 후 비동기 호출
+ANALYSIS_WORKERS = int(os.environ.get('AIATLAS_ANALYSIS_WORKERS', '1'))          # 수집 1회당 최대 호출 수
+ANALYSIS_LEASE_SECONDS = 300   # 작업자가 가져간 기사를 다른 작업자가 가져가지 않는 시간
+ANALYSIS_MAX_ATTEMPTS = 3      # 분석 실패 허용 횟수 (초과 시 status=failed)
+
+# 유사 기사 묶기 (수집 단계에서 SimHash 거리로 같은 사건 보도를 묶어 대표만 분석, 음수면 비활성화)
+NEWS_DEDUP_MAX_DISTANCE = int(os.environ.get('AIATLAS_DEDUP_MAX_DISTANCE', '16'))  # SimHash 두 개 각각의 다른 비트 수 (64비트 중)
+NEWS_SIGNATURE_HOURS = int(os.environ.get('AIATLAS_DEDUP_WINDOW_HOURS', '72'))     # 비교 대상 최근 기사 범위
+NEWS_SIGNATURE_MAX = 2000      # 보관하는 최근 서명 수 (config 항목 400KB 제한 이내)
+
+# 뉴스 소스 설정 (우선순위별 폴링 간격 포함)
+NEWS_SOURCES_PATH = os.environ.get(
+    'AIATLAS_NEWS_SOURCES_PATH',
+    os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'config', 'news_sources.json')
+)
+
+# 공개 조회 응답 캐시 (웜 컨테이너 내 TTL 캐시, 쓰기 시 콘텐츠 버전으로 무효화)
+RESPONSE_CACHE_TTL = int(os.environ.get('AIATLAS_RESPONSE_CACHE_TTL', '300'))
+VERSION_CHECK_INTERVAL = float(os.environ.get('AIATLAS_VERSION_CHECK_INTERVAL', '5'))
+
+# 콜드 스타트 초기화 시간 리포트 (1이면 첫 요청 후 구간별 시간을 로그 한 줄로 출력)
+INIT_TIMING_ENABLED = os.environ.get('AIATLAS_INIT_TIMING', '') == '1'
+
+# CloudWatch EMF 지표 (요청 단위 샘플링 비율 0~1, 0이면 비활성)
+METRICS_NAMESPACE = os.environ.get('AIATLAS_METRICS_NAMESPACE', 'AIAtlas')
+METRICS_SAMPLE_RATE = float(os.environ.get('AIATLAS_METRICS_SAMPLE_RATE', '1'))
+
+# 응답 압축 (Accept-Encoding 협상, 이 크기 미만 본문은 압축하지 않음)
+COMPRESSION_ENABLED = os.environ.get('AIATLAS_COMPRESSION', 'on') != 'off'
+COMPRESSION_MIN_BYTES = int(os.environ.get('AIATLAS_COMPRESSION_MIN_BYTES', '2048'))
 
 # 뉴스 카테고리
 NEWS_CATEGORIES = {
@@ -31,6 +112,7 @@ NEWS_CATEGORIES = {
     'politics': '정치',
     'society': '사회'
 }
+NEWS_PERSPECTIVES = ('Civilization', 'Science', 'Industry', 'Governance')
 
 # 관리자 인증 (환경변수)
 ADMIN_ID = os.environ.get('AIATLAS_ADMIN_ID', 'admin')
@@ -196,26 +278,280 @@ IRREVERSIBLE_CHOICES = [
 ]
 
 
-class DecimalEncoder(json.JSONEncoder):
-    def default(self, obj):
-        if isinstance(obj, Decimal):
-            return float(obj) if obj % 1 else int(obj)
-        return super().default(obj)
+# ==========================================
+# JSON 직렬화 / DynamoDB 숫자 변환
+# ==========================================
+# DynamoDB 숫자(Decimal)는 읽을 때 한 번 int/float로 바꿔 두고 (InstrumentedDynamo),
+# 응답 직렬화는 orjson이 있으면 사용한다. 직렬화 중 Decimal 훅이 항목마다 돌지 않게 함.
+
+try:
+    import orjson  # 선택 의존성
+except ImportError:
+    orjson = None
+
+_CONVERTED_TYPES = (Decimal, dict, list, set)
+
+
+def decimal_to_number(value: Decimal):
+    """Decimal -> int (정수 값) / float"""
+    number = int(value)
+    return number if number == value else float(value)
+
+
+def from_dynamo(value):
+    """DynamoDB에서 읽은 값의 Decimal을 int/float로, set을 list로 변환
+
+    boto3가 새로 만든 dict/list는 제자리에서 바꾼다. 문자열 필드는 건너뛰므로
+    텍스트 위주인 뉴스/이벤트 항목은 거의 비용이 없다.
+    """
+    kind = type(value)
+    if kind is dict:
+        for key, field in value.items():
+            if type(field) in _CONVERTED_TYPES:
+                value[key] = from_dynamo(field)
+        return value
+    if kind is list:
+        for i, field in enumerate(value):
+            if type(field) in _CONVERTED_TYPES:
+                value[i] = from_dynamo(field)
+        return value
+    if kind is Decimal:
+        return decimal_to_number(value)
+    if kind is set:
+        return [from_dynamo(field) for field in value]
+    return value
+
+
+# 테이블별 숫자 필드 (읽을 때 이 필드만 변환, 목록에 없는 테이블은 항목 전체를 순회)
+# 목록에서 빠진 Decimal은 직렬화 시 _json_default가 처리하므로 결과는 같다.
+NUMBER_FIELDS = {
+    TABLE_NEWS: ('attempts', 'lease_until', 'duplicates'),
+    TABLE_EVENTS: (),
+    TABLE_LLM_CACHE: ('expires_at',),
+    TABLE_SEARCH: (),
+}
 
 
-def json_response(status_code: int, body: dict) -> dict:
+def convert_fields(item: dict, fields: tuple) -> dict:
+    """항목의 지정 필드만 Decimal -> int/float 변환"""
+    for field in fields:
+        value = item.get(field)
+        if type(value) is Decimal:
+            item[field] = decimal_to_number(value)
+    return item
+
+
+def to_dynamo(value):
+    """쓰기 전 float -> Decimal 변환 (boto3는 float를 거부)"""
+    kind = type(value)
+    if kind is float:
+        return Decimal(str(value))
+    if kind is dict:
+        return {key: to_dynamo(field) for key, field in value.items()}
+    if kind is list:
+        return [to_dynamo(field) for field in value]
+    return value
+
+
+def _json_default(obj):
+    """읽기 경로를 거치지 않은 Decimal / set 처리"""
+    if isinstance(obj, Decimal):
+        return decimal_to_number(obj)
+    if isinstance(obj, (set, frozenset)):
+        return list(obj)
+    raise TypeError(f'{type(obj).__name__} is not JSON serializable')
+
+
+def dumps_json(body) -> str:
+    """응답/캐시용 JSON 직렬화 (orjson 우선, 없으면 표준 json)"""
+    if orjson is not None:
+        return orjson.dumps(body, default=_json_default, option=orjson.OPT_NON_STR_KEYS).decode('utf-8')
+    return json.dumps(body, ensure_ascii=False, separators=(',', ':'), default=_json_default)
+
+
+def json_response(status_code: int, body, event: dict = None, etag: str = None,
+                  cache_control: str = None) -> dict:
+    """JSON 응답 생성
+
+    body는 dict 또는 미리 직렬화된 JSON 문자열. etag를 주면 요청의
+    If-None-Match와 비교해 일치 시 본문 없이 304를 반환한다.
+    """
+    headers = {
+        'Content-Type': 'application/json',
+        'Access-Control-Allow-Origin': '*',
+        'Access-Control-Allow-Headers': 'Content-Type,Authorization,If-None-Match',
+        'Access-Control-Allow-Methods': 'GET,POST,PUT,DELETE,OPTIONS'
+    }
+    if cache_control:
+        headers['Cache-Control'] = cache_control
+    if etag:
+        headers['ETag'] = etag
+        if event is not None and etag_matches(event, etag):
+            # 304에도 같은 본문의 200 응답과 같은 ETag(압축 시 W/)와 Vary를 붙임
+            body = body if isinstance(body, str) else dumps_json(body)
+            if compressible(body):
+                compression_headers(headers, event)
+            return {'statusCode': 304, 'headers': headers, 'body': ''}
     return {
         'statusCode': status_code,
-        'headers': {
-            'Content-Type': 'application/json',
-            'Access-Control-Allow-Origin': '*',
-            'Access-Control-Allow-Headers': 'Content-Type,Authorization',
-            'Access-Control-Allow-Methods': 'GET,POST,PUT,DELETE,OPTIONS'
-        },
-        'body': json.dumps(body, ensure_ascii=False, cls=DecimalEncoder)
+        'headers': headers,
+        'body': body if isinstance(body, str) else dumps_json(body)
     }
 
 
+def etag_matches(event: dict, etag: str) -> bool:
+    """요청의 If-None-Match 헤더가 etag와 일치하는지 확인"""
+    headers = event.get('headers', {}) or {}
+    value = headers.get('If-None-Match') or headers.get('if-none-match') or ''
+    candidates = [tag.strip() for tag in value.split(',')]
+    return '*' in candidates or etag in candidates or f'W/{etag}' in candidates
+
+
+def prerender(body: dict) -> tuple:
+    """고정 응답 본문을 한 번만 직렬화하고 내용 해시로 강한 ETag 생성
+
+    반환: (body 문자열, ETag)
+    """
+    raw = dumps_json(body)
+    return raw, '"' + hashlib.sha256(raw.encode('utf-8')).hexdigest()[:32] + '"'
+
+
+# 고정 데이터 응답 (import 시 1회 직렬화, 브라우저/CloudFront 캐시 허용)
+STATIC_CACHE_CONTROL = 'public, max-age=300, s-maxage=3600'
+STATIC_BODIES = {
+    'roadmaps': prerender({
+        'success': True,
+        'roadmaps': list(TECHNOLOGY_ROADMAPS.values())
+    }),
+    'irreversibles': prerender({
+        'success': True,
+        'irreversibles': IRREVERSIBLE_CHOICES
+    }),
+    'outlook': prerender({
+        'success': True,
+        'scenarios': SCENARIOS,
+        'epochs': EPOCHS
+    }),
+    'governance': prerender({
+        'success': True,
+        'governance_shift': GOVERNANCE_SHIFT
+    })
+}
+
+
+def static_response(name: str, event: dict) -> dict:
+    """미리 직렬화된 고정 응답 반환 (ETag 일치 시 304)"""
+    body, etag = STATIC_BODIES[name]
+    return json_response(200, body, event, etag=etag, cache_control=STATIC_CACHE_CONTROL)
+
+
+# ==========================================
+# 응답 압축
+# ==========================================
+
+# 같은 본문(캐시된 응답, 정적 응답)을 매번 다시 압축하지 않도록 최근 결과 보관
+_compressed_bodies = OrderedDict()
+COMPRESSED_CACHE_SIZE = 32
+_brotli = False  # 최초 사용 시 import 시도, 없으면 None
+
+
+def accepted_encoding(event: dict) -> str:
+    """Accept-Encoding에서 사용할 인코딩 선택 (br 우선, 없으면 gzip, 둘 다 불가면 None)"""
+    headers = event.get('headers') or {}
+    value = headers.get('Accept-Encoding') or headers.get('accept-encoding') or ''
+    weights = {}
+    for part in value.split(','):
+        name, _, params = part.strip().partition(';')
+        q = 1.0
+        if params.strip().startswith('q='):
+            try:
+                q = float(params.strip()[2:])
+            except ValueError:
+                q = 0.0
+        if name:
+            weights[name.strip().lower()] = q
+
+    wildcard = weights.get('*', 0)
+    for encoding in ('br', 'gzip'):
+        if weights.get(encoding, wildcard) > 0 and (encoding != 'br' or _brotli_module() is not None):
+            return encoding
+    return None
+
+
+def _brotli_module():
+    """brotli 패키지 (설치되어 있지 않으면 None)"""
+    global _brotli
+    if _brotli is False:
+        try:
+            import brotli
+            _brotli = brotli
+        except ImportError:
+            _brotli = None
+    return _brotli
+
+
+def compress_body(body: str, encoding: str) -> str:
+    """본문을 압축해 base64 문자열로 반환 (최근 결과 재사용)"""
+    key = (encoding, body)
+    encoded = _compressed_bodies.get(key)
+    if encoded is not None:
+        _compressed_bodies.move_to_end(key)
+        return encoded
+
+    import gzip
+
+    data = body.encode('utf-8')
+    if encoding == 'br':
+        compressed = _brotli_module().compress(data, quality=5)
+    else:
+        compressed = gzip.compress(data, compresslevel=6, mtime=0)
+    encoded = base64.b64encode(compressed).decode('ascii')
+    _compressed_bodies[key] = encoded
+    if len(_compressed_bodies) > COMPRESSED_CACHE_SIZE:
+        _compressed_bodies.popitem(last=False)
+    return encoded
+
+
+def compress_response(response: dict, event: dict) -> dict:
+    """클라이언트가 지원하면 본문을 gzip/brotli로 압축 (API Gateway isBase64Encoded 응답)
+
+    COMPRESSION_MIN_BYTES 미만이거나 이미 인코딩된 응답은 그대로 둔다.
+    압축본의 ETag는 약한 ETag(W/)로 바꿔 원본과 구분하고, If-None-Match 비교는 그대로 동작한다.
+    """
+    body = response.get('body')
+    if response.get('isBase64Encoded') or not compressible(body):
+        return response
+
+    encoding = compression_headers(response.setdefault('headers', {}), event)
+    if encoding is None:
+        return response
+
+    headers = response['headers']
+    headers['Content-Encoding'] = encoding
+    response['body'] = compress_body(body, encoding)
+    response['isBase64Encoded'] = True
+    return response
+
+
+def compressible(body) -> bool:
+    """압축 대상 본문인지 (압축 사용 중이고 COMPRESSION_MIN_BYTES 이상인 문자열)"""
+    return COMPRESSION_ENABLED and isinstance(body, str) and len(body) >= COMPRESSION_MIN_BYTES
+
+
+def compression_headers(headers: dict, event: dict):
+    """압축 대상 응답(200 / 304)의 Vary와 ETag 설정
+
+    압축할 인코딩이 있으면 ETag를 약한 ETag(W/)로 바꾼다.
+    반환: 사용할 인코딩 (없으면 None)
+    """
+    headers['Vary'] = 'Accept-Encoding'
+    encoding = accepted_encoding(event)
+    etag = headers.get('ETag')
+    if encoding is not None and etag and not etag.startswith('W/'):
+        headers['ETag'] = 'W/' + etag
+    return encoding
+
+
 def verify_auth(event: dict) -> bool:
     """간단한 인증 체크"""
     headers = event.get('headers', {}) or {}
@@ -232,6 +568,609 @@ def generate_token(password: str) -> str:
     return hashlib.sha256(password.encode()).hexdigest()[:32]
 
 
+# ==========================================
+# 요청 지표 (CloudWatch Embedded Metric Format)
+# ==========================================
+
+# 요청 1건 동안 누적되는 지표 (수집 파이프라인 스레드에서도 기록하므로 락 사용)
+#   values: {이름: 합계} / observations: {이름: [관측값]} / units: {이름: 단위}
+_metrics = None
+_metrics_lock = threading.Lock()
+_cold_start = True
+EMF_MAX_VALUES = 100  # EMF 지표 하나에 담을 수 있는 최대 값 개수
+
+
+def metrics_begin() -> None:
+    """요청 지표 수집 시작 (샘플링에서 제외되면 기록하지 않음)"""
+    global _metrics
+    if METRICS_SAMPLE_RATE > 0 and random.random() < METRICS_SAMPLE_RATE:
+        _metrics = {'started': time.perf_counter(), 'properties': {}, 'values': {}, 'observations': {}, 'units': {}}
+    else:
+        _metrics = None
+
+
+def set_metric_property(name: str, value) -> None:
+    """지표 로그에 함께 남길 속성 (Route 등)"""
+    if _metrics is not None:
+        _metrics['properties'][name] = value
+
+
+def add_metric(name: str, value: float, unit: str = 'Count') -> None:
+    """요청 단위 합계 지표 (소비 용량, 조회 건수 등)"""
+    metrics = _metrics
+    if metrics is None:
+        return
+    with _metrics_lock:
+        metrics['values'][name] = metrics['values'].get(name, 0) + value
+        metrics['units'][name] = unit
+
+
+def observe_metric(name: str, value: float, unit: str = 'Milliseconds') -> None:
+    """호출별 관측값 지표 (지연 시간 등, p50/p99용)"""
+    metrics = _metrics
+    if metrics is None:
+        return
+    with _metrics_lock:
+        values = metrics['observations'].setdefault(name, [])
+        if len(values) < EMF_MAX_VALUES:
+            values.append(round(value, 2))
+        metrics['units'][name] = unit
+
+
+@contextmanager
+def timed_metric(name: str):
+    """블록 실행 시간을 관측값 지표로 기록"""
+    if _metrics is None:
+        yield
+        return
+    started = time.perf_counter()
+    try:
+        yield
+    finally:
+        observe_metric(name, (time.perf_counter() - started) * 1000)
+
+
+def metrics_end(response: dict = None) -> None:
+    """요청 지표를 EMF JSON 로그 한 줄로 출력"""
+    global _metrics, _cold_start
+    metrics, _metrics = _metrics, None
+    cold_start, _cold_start = _cold_start, False
+    if metrics is None:
+        return
+
+    try:
+        latency = (time.perf_counter() - metrics['started']) * 1000
+        record = dict(metrics['properties'])
+        record.setdefault('Route', 'unmatched')
+        record['ColdStart'] = cold_start
+        record['StatusCode'] = response['statusCode'] if response else 500
+        record['RequestLatency'] = round(latency, 2)
+        record['ColdStartCount'] = 1 if cold_start else 0
+        units = {'RequestLatency': 'Milliseconds', 'ColdStartCount': 'Count', **metrics['units']}
+        record.update(metrics['values'])
+        record.update(metrics['observations'])
+        record['_aws'] = {
+            'Timestamp': int(time.time() * 1000),
+            'CloudWatchMetrics': [{
+                'Namespace': METRICS_NAMESPACE,
+                'Dimensions': [['Route']],
+                'Metrics': [{'Name': name, 'Unit': unit} for name, unit in units.items()]
+            }]
+        }
+        print(json.dumps(record, ensure_ascii=False))
+    except Exception as e:
+        print(f"Error emitting metrics: {e}")
+
+
+class InstrumentedDynamo:
+    """DynamoDB 리소스/Table 프록시
+
+    읽기 응답의 숫자는 한 번만 int/float로 변환하고, 요청 값의 float는 Decimal로 바꾼다.
+    지표 수집 중인 요청에서는 ReturnConsumedCapacity를 붙여 호출 시간,
+    소비 RCU/WCU, query/scan의 읽은 건수(ScannedCount)와 반환 건수(Count)를 기록한다.
+    그 외 속성은 원본 객체로 그대로 전달한다.
+    """
+
+    READ_OPS = ('get_item', 'query', 'scan', 'batch_get_item')
+    WRITE_OPS = ('put_item', 'update_item', 'delete_item', 'batch_write_item')
+    # 응답에서 항목이 담기는 키 / float 변환이 필요한 요청 인자
+    RESULT_KEYS = ('Item', 'Items', 'Attributes', 'Responses', 'LastEvaluatedKey')
+    VALUE_ARGS = ('Item', 'Key', 'ExpressionAttributeValues', 'ExclusiveStartKey', 'RequestItems')
+
+    def __init__(self, target, table_name: str = None):
+        self._target = target
+        self._fields = NUMBER_FIELDS.get(table_name)
+
+    def __getattr__(self, name):
+        attr = getattr(self._target, name)
+        if name == 'Table':
+            return lambda table_name: InstrumentedDynamo(attr(table_name), table_name)
+        if name not in self.READ_OPS and name not in self.WRITE_OPS:
+            return attr
+
+        def call(**kwargs):
+            for arg in self.VALUE_ARGS:
+                if arg in kwargs:
+                    kwargs[arg] = to_dynamo(kwargs[arg])
+            response = self._measured(name, attr, kwargs) if _metrics is not None else attr(**kwargs)
+            self._convert(response)
+            return response
+
+        return call
+
+    def _convert(self, response: dict) -> None:
+        """읽기 응답의 항목 변환 (테이블 필드 목록이 있으면 해당 필드만)"""
+        fields = self._fields
+        for key in self.RESULT_KEYS:
+            if key not in response:
+                continue
+            if fields is None or key in ('Responses', 'LastEvaluatedKey'):
+                from_dynamo(response[key])
+            elif key == 'Items':
+                for item in response['Items']:
+                    convert_fields(item, fields)
+            else:
+                convert_fields(response[key], fields)
+
+    def _measured(self, name, attr, kwargs):
+        """지표 수집 중인 요청의 DynamoDB 호출"""
+        kwargs.setdefault('ReturnConsumedCapacity', 'TOTAL')
+        started = time.perf_counter()
+        try:
+            response = attr(**kwargs)
+        finally:
+            observe_metric('DynamoDBLatency', (time.perf_counter() - started) * 1000)
+            add_metric('DynamoDBCalls', 1)
+
+        capacity = response.get('ConsumedCapacity') or []
+        if isinstance(capacity, dict):
+            capacity = [capacity]
+        units = sum(float(c.get('CapacityUnits', 0)) for c in capacity)
+        add_metric('DynamoDBReadCapacity' if name in self.READ_OPS else 'DynamoDBWriteCapacity', units)
+        if name in ('query', 'scan'):
+            add_metric('DynamoDBScannedCount', response.get('ScannedCount', 0))
+            add_metric('DynamoDBReturnedCount', response.get('Count', 0))
+        return response
+
+
+# ==========================================
+# DynamoDB 연결 / 초기화 시간 측정
+# ==========================================
+
+_dynamodb = None
+_dynamodb_lock = threading.Lock()
+_tables = {}
+_init_spans = {}
+_init_reported = False
+
+
+@contextmanager
+def init_span(name: str):
+    """초기화 구간 시간 기록 (ms)"""
+    started = time.perf_counter()
+    try:
+        yield
+    finally:
+        _init_spans[name] = round((time.perf_counter() - started) * 1000, 2)
+
+
+def get_dynamodb():
+    """DynamoDB 리소스 (최초 사용 시 생성, 컨테이너 내 재사용, 지표 프록시 적용)"""
+    global _dynamodb
+    if _dynamodb is None:
+        with _dynamodb_lock:
+            if _dynamodb is None:
+                with init_span('boto3_import'):
+                    import boto3
+                with init_span('dynamodb_resource'):
+                    _dynamodb = InstrumentedDynamo(boto3.resource('dynamodb', region_name=DYNAMODB_REGION))
+    return _dynamodb
+
+
+def get_table(name: str):
+    """DynamoDB Table 객체 (테이블별 1회 생성)"""
+    table = _tables.get(name)
+    if table is None:
+        table = _tables[name] = get_dynamodb().Table(name)
+    return table
+
+
+def report_init_timing() -> None:
+    """첫 요청 처리 후 초기화 구간별 시간을 로그 한 줄로 출력 (AIATLAS_INIT_TIMING=1)"""
+    global _init_reported
+    if not INIT_TIMING_ENABLED or _init_reported:
+        return
+    _init_reported = True
+    print(json.dumps({
+        'message': 'aiatlas init timing',
+        'spans_ms': _init_spans,
+        'since_module_load_ms': round((time.perf_counter() - _MODULE_LOAD_STARTED) * 1000, 2)
+    }))
+
+
+# ==========================================
+# DynamoDB 조회 헬퍼
+# ==========================================
+
+# 존재하지 않는 것으로 확인된 인덱스 (컨테이너 수명 동안 재시도하지 않음)
+_missing_indexes = set()
+
+
+def dynamo_error_code(e: Exception) -> str:
+    """botocore ClientError의 에러 코드 추출"""
+    return (getattr(e, 'response', None) or {}).get('Error', {}).get('Code', '')
+
+
+def is_missing_index_error(e: Exception) -> bool:
+    """GSI가 없어서 발생한 에러인지 확인"""
+    return dynamo_error_code(e) == 'ValidationException' and 'index' in str(e).lower()
+
+
+def read_pages(read, kwargs: dict, limit: int = None, start_key: dict = None) -> tuple:
+    """LastEvaluatedKey를 따라가며 limit개까지 읽기 (1MB 페이지 경계에서 누락 없음)
+
+    반환: (items, last_key) - last_key가 있으면 다음 페이지 존재
+    """
+    items = []
+    kwargs = dict(kwargs)
+    if start_key:
+        kwargs['ExclusiveStartKey'] = start_key
+    while True:
+        if limit is not None:
+            kwargs['Limit'] = limit - len(items)
+        response = read(**kwargs)
+        items.extend(response.get('Items', []))
+        last_key = response.get('LastEvaluatedKey')
+        if not last_key or (limit is not None and len(items) >= limit):
+            return items, last_key
+        kwargs['ExclusiveStartKey'] = last_key
+
+
+def index_key(item: dict, partition_key: str, sort_key: str) -> dict:
+    """항목의 페이지네이션 키 (GSI 키 형식, scan 폴백도 같은 형식을 정렬 위치로 사용)"""
+    return {'pk': item['pk'], partition_key: item[partition_key], sort_key: item[sort_key]}
+
+
+def sort_page(items: list, sort_key: str, limit: int = None, start_key: dict = None,
+              newest_first: bool = True, key_of=None) -> tuple:
+    """전체 항목을 (정렬키, pk) 순서로 정렬해 start_key 위치 다음부터 limit개 (scan 경로용)
+
+    key_of(item)은 다음 페이지 커서에 담을 키 (기본: pk + 정렬키).
+    반환: (items, last_key)
+    """
+    position = lambda item: (item.get(sort_key, ''), item['pk'])
+    items = sorted(items, key=position, reverse=newest_first)
+    if start_key:
+        after = (start_key.get(sort_key, ''), start_key.get('pk', ''))
+        items = [item for item in items if (position(item) < after if newest_first else position(item) > after)]
+    if limit is None or len(items) <= limit:
+        return items, None
+    items = items[:limit]
+    last_key = key_of(items[-1]) if key_of else {'pk': items[-1]['pk'], sort_key: items[-1].get(sort_key, '')}
+    return items, last_key
+
+
+def query_published(table, index_name: str, sort_key: str, limit: int = None,
+                    start_key: dict = None) -> tuple:
+    """status GSI로 게시된 항목을 최신순으로 조회 (limit개까지만 읽음)
+
+    반환: (items, last_key)
+    """
+    return query_by_status(table, index_name, sort_key, 'published', limit, start_key)
+
+
+def query_by_status(table, index_name: str, sort_key: str, status: str, limit: int = None,
+                    start_key: dict = None, newest_first: bool = True,
+                    filter_expression: str = None, filter_values: dict = None,
+                    since: str = None) -> tuple:
+    """status GSI로 특정 상태의 항목을 정렬키 순서로 조회 (GSI가 없으면 scan 폴백)
+
+    반환: (items, last_key)
+    """
+    return query_index(table, index_name, 'status', status, sort_key, limit, start_key,
+                       newest_first, filter_expression, filter_values, since)
+
+
+def query_index(table, index_name: str, partition_key: str, partition_value: str, sort_key: str,
+                limit: int = None, start_key: dict = None, newest_first: bool = True,
+                filter_expression: str = None, filter_values: dict = None, since: str = None) -> tuple:
+    """GSI 파티션 하나를 정렬키 순서로 조회 (since 이후만, GSI가 없으면 scan 폴백)
+
+    반환: (items, last_key)
+    """
+    key_condition = '#pkey = :pkey'
+    names = {'#pkey': partition_key}
+    values = {':pkey': partition_value, **(filter_values or {})}
+    if since:
+        key_condition += ' AND #skey >= :since'
+        names['#skey'] = sort_key
+        values[':since'] = since
+    params = {'ExpressionAttributeNames': names, 'ExpressionAttributeValues': values}
+    if index_name not in _missing_indexes:
+        try:
+            query = {
+                'IndexName': index_name,
+                'KeyConditionExpression': key_condition,
+                'ScanIndexForward': not newest_first,
+                **params
+            }
+            if filter_expression:
+                query['FilterExpression'] = filter_expression
+            return read_pages(table.query, query, limit, start_key)
+        except Exception as e:
+            if not is_missing_index_error(e):
+                raise
+            print(f"Index {index_name} not found, falling back to scan")
+            _missing_indexes.add(index_name)
+
+    # 폴백: 조건에 맞는 항목을 모두 scan한 뒤 정렬하고 커서 위치 다음부터 limit개
+    # (scan 순서로 limit개만 읽으면 최신/오래된 순이 아니게 됨)
+    condition = key_condition
+    if filter_expression:
+        condition += f' AND ({filter_expression})'
+    items, _ = read_pages(table.scan, {'FilterExpression': condition, **params})
+    return sort_page(items, sort_key, limit, start_key, newest_first,
+                     key_of=lambda item: index_key(item, partition_key, sort_key))
+
+
+BATCH_WRITE_SIZE = 25          # BatchWriteItem 최대 항목 수
+BATCH_WRITE_MAX_ATTEMPTS = 6
+BATCH_WRITE_BACKOFF = 0.05     # 재시도 대기 시작값 (초, 2배씩 증가)
+RETRYABLE_ERROR_CODES = {
+    'ProvisionedThroughputExceededException', 'ThrottlingException',
+    'RequestLimitExceeded', 'InternalServerError'
+}
+
+
+def batch_write_items(table_name: str, items: list, delete: bool = False,
+                      key_attributes: tuple = ('pk',)) -> dict:
+    """BatchWriteItem(25개 단위)으로 저장, UnprocessedItems는 지수 백오프로 재시도
+
+    delete=True면 items를 키로 보고 삭제한다. 복합 키 테이블은 key_attributes로 키 속성 지정.
+    반환: {'succeeded': [key, ...], 'failed': [key, ...]} - key는 pk (복합 키면 키 값 튜플)
+    """
+    if len(key_attributes) == 1:
+        key_of = lambda item: item[key_attributes[0]]
+    else:
+        key_of = lambda item: tuple(item[name] for name in key_attributes)
+
+    succeeded, failed = [], []
+    for i in range(0, len(items), BATCH_WRITE_SIZE):
+        pending = [
+            {'DeleteRequest': {'Key': item}} if delete else {'PutRequest': {'Item': item}}
+            for item in items[i:i + BATCH_WRITE_SIZE]
+        ]
+        for attempt in range(BATCH_WRITE_MAX_ATTEMPTS):
+            try:
+                response = get_dynamodb().batch_write_item(RequestItems={table_name: pending})
+                pending = (response.get('UnprocessedItems') or {}).get(table_name, [])
+            except Exception as e:
+                if dynamo_error_code(e) not in RETRYABLE_ERROR_CODES:
+                    print(f"Batch write error ({table_name}): {e}")
+                    break
+            if not pending:
+                break
+            time.sleep(BATCH_WRITE_BACKOFF * (2 ** attempt))
+        failed_keys = {
+            key_of(request['DeleteRequest']['Key'] if delete else request['PutRequest']['Item'])
+            for request in pending
+        }
+        for item in items[i:i + BATCH_WRITE_SIZE]:
+            (failed if key_of(item) in failed_keys else succeeded).append(key_of(item))
+    return {'succeeded': succeeded, 'failed': failed}
+
+
+# ==========================================
+# 페이지네이션
+# ==========================================
+
+DEFAULT_PAGE_LIMIT = 50
+MAX_PAGE_LIMIT = 100
+
+
+def encode_cursor(last_key: dict) -> str:
+    """LastEvaluatedKey -> 불투명 커서 문자열"""
+    if not last_key:
+        return None
+    raw = dumps_json(last_key)
+    return base64.urlsafe_b64encode(raw.encode('utf-8')).decode('ascii').rstrip('=')
+
+
+def decode_cursor(cursor: str) -> dict:
+    """커서 문자열 -> ExclusiveStartKey (잘못된 커서는 ValueError)"""
+    try:
+        padded = cursor + '=' * (-len(cursor) % 4)
+        key = json.loads(base64.urlsafe_b64decode(padded.encode('ascii')))
+    except Exception:
+        raise ValueError('Invalid cursor')
+    if not isinstance(key, dict):
+        raise ValueError('Invalid cursor')
+    return key
+
+
+def check_cursor(start_key: dict, sort_key: str, scan: bool = False, **partition) -> None:
+    """커서가 조회할 인덱스의 키(pk, 파티션 키, 정렬키)만 담고 있는지 확인 (아니면 ValueError)
+
+    오래되었거나 다른 목록의 커서를 ExclusiveStartKey로 넘기면 DynamoDB ValidationException이 나므로
+    조회 전에 400으로 거절한다. scan 경로(scan=True)의 커서는 정렬 위치일 뿐이라 정렬키가 빈 문자열이어도 된다
+    (date 없이 저장된 기존 이벤트).
+    """
+    if start_key is None:
+        return
+    if (set(start_key) != {'pk', sort_key, *partition}
+            or not all(isinstance(value, str) for value in start_key.values())
+            or not all(value for name, value in start_key.items() if name != sort_key or not scan)
+            or any(start_key[name] != value for name, value in partition.items())):
+        raise ValueError('Invalid cursor')
+
+
+def get_page_params(event: dict) -> tuple:
+    """쿼리스트링에서 limit, cursor 추출
+
+    반환: (limit, start_key)
+    """
+    params = event.get('queryStringParameters') or {}
+    try:
+        limit = int(params.get('limit') or DEFAULT_PAGE_LIMIT)
+    except ValueError:
+        raise ValueError('Invalid limit')
+    limit = max(1, min(limit, MAX_PAGE_LIMIT))
+    cursor = params.get('cursor')
+    return limit, decode_cursor(cursor) if cursor else None
+
+
+# ==========================================
+# 공개 조회 응답 캐시
+# ==========================================
+
+# key -> (content_version, expires_at, response)
+_response_cache = {}
+_content_version = {'value': None, 'checked_at': 0.0}
+
+
+def get_content_version():
+    """콘텐츠 버전 조회 (VERSION_CHECK_INTERVAL초에 최대 1회 GetItem, 실패 시 None)"""
+    now = time.monotonic()
+    if _content_version['value'] is None or now - _content_version['checked_at'] >= VERSION_CHECK_INTERVAL:
+        try:
+            item = get_table(TABLE_CONFIG).get_item(Key={'pk': 'CONTENT_VERSION'}).get('Item') or {}
+            _content_version['value'] = int(item.get('version', 0))
+            _content_version['checked_at'] = now
+        except Exception as e:
+            print(f"Error reading content version: {e}")
+            return None
+    return _content_version['value']
+
+
+def bump_content_version() -> None:
+    """공개 데이터 변경 알림 - 모든 컨테이너의 응답 캐시 무효화"""
+    try:
+        response = get_table(TABLE_CONFIG).update_item(
+            Key={'pk': 'CONTENT_VERSION'},
+            UpdateExpression='ADD version :one',
+            ExpressionAttributeValues={':one': 1},
+            ReturnValues='UPDATED_NEW'
+        )
+        _content_version['value'] = int(response['Attributes']['version'])
+        _content_version['checked_at'] = time.monotonic()
+    except Exception as e:
+        print(f"Error bumping content version: {e}")
+
+
+def cached_response(key, build) -> dict:
+    """콘텐츠 버전이 같고 TTL 이내면 저장된 응답 반환, 아니면 build()로 생성 후 저장"""
+    version = get_content_version()
+    if version is None:
+        return build()
+
+    entry = _response_cache.get(key)
+    if entry and entry[0] == version and entry[1] > time.monotonic():
+        response = entry[2]
+    else:
+        response = build()
+        if response['statusCode'] != 200:
+            return response
+        _response_cache[key] = (version, time.monotonic() + RESPONSE_CACHE_TTL, response)
+    return {**response, 'headers': dict(response['headers'])}
+
+
+# ==========================================
+# 최신 N개 구체화 항목 (Materialized View)
+# ==========================================
+
+# config 테이블의 단일 항목에 게시된 최신 N개를 비정규화해 저장 -> 읽기는 GetItem 1회
+MATERIALIZED_VIEWS = {
+    'LATEST_NEWS': {'table': TABLE_NEWS, 'index': NEWS_STATUS_INDEX, 'sort_key': 'created_at', 'size': 8},
+    'PUBLIC_TIMELINE': {'table': TABLE_EVENTS, 'index': EVENTS_STATUS_INDEX, 'sort_key': 'date', 'size': DEFAULT_PAGE_LIMIT}
+}
+
+
+def read_materialized(view_key: str):
+    """구체화 항목 조회 (없거나 오류면 None -> 호출자가 인덱스 조회로 폴백)"""
+    try:
+        item = get_table(TABLE_CONFIG).get_item(Key={'pk': view_key}).get('Item')
+    except Exception as e:
+        print(f"Error reading {view_key}: {e}")
+        return None
+    return item.get('items', []) if item else None
+
+
+def rebuild_materialized(view_key: str) -> list:
+    """기준 테이블에서 최신 N개를 다시 계산해 구체화 항목 재생성 (대량 입력/삭제 후)"""
+    view = MATERIALIZED_VIEWS[view_key]
+    items, _ = query_published(get_table(view['table']), view['index'], view['sort_key'], view['size'])
+    # 버전을 올려서 진행 중인 병합 쓰기가 조건 실패 후 재시도하도록 함
+    get_table(TABLE_CONFIG).update_item(
+        Key={'pk': view_key},
+        UpdateExpression='SET #items = :items, updated_at = :now ADD #version :one',
+        ExpressionAttributeNames={'#items': 'items', '#version': 'version'},
+        ExpressionAttributeValues={':items': items, ':now': datetime.utcnow().isoformat(), ':one': 1}
+    )
+    return items
+
+
+def update_materialized(view_key: str, new_items: list, removed: list = ()) -> None:
+    """새로 게시된 항목을 구체화 항목에 병합하고 삭제된 항목(pk)을 제거 (version 조건부 쓰기, 충돌 시 재시도)
+
+    GSI는 최종 일관성이라 방금 쓴 항목이 빠지거나 방금 지운 항목이 남을 수 있으므로
+    인덱스로 다시 계산하지 않고 현재 구체화 항목을 직접 고친다.
+    """
+    view = MATERIALIZED_VIEWS[view_key]
+    sort_key = view['sort_key']
+    removed = set(removed)
+    table = get_table(TABLE_CONFIG)
+    for attempt in range(5):
+        current = table.get_item(Key={'pk': view_key}, ConsistentRead=True).get('Item')
+        if current is None:
+            # 아직 없으면 기준 테이블의 최신 N개에서 시작
+            base, _ = query_published(get_table(view['table']), view['index'], sort_key, view['size'])
+        else:
+            base = current.get('items', [])
+        merged = {item['pk']: item for item in base if item['pk'] not in removed}
+        if current is not None and not new_items and len(merged) == len(base):
+            return
+        merged.update({item['pk']: item for item in new_items})
+        if base and len(base) >= view['size'] and len(merged) < view['size']:
+            # 삭제로 빈 자리는 기존 마지막 항목 다음부터 채움 (지운 항목은 그 앞이라 다시 들어오지 않음)
+            refill, _ = query_published(get_table(view['table']), view['index'], sort_key,
+                                        view['size'] - len(merged), index_key(base[-1], 'status', sort_key))
+            merged.update({item['pk']: item for item in refill if item['pk'] not in removed})
+        items = sorted(merged.values(), key=lambda x: (x.get(sort_key, ''), x['pk']), reverse=True)
+        try:
+            table.put_item(
+                Item={
+                    'pk': view_key,
+                    'items': items[:view['size']],
+                    'version': (current or {}).get('version', 0) + 1,
+                    'updated_at': datetime.utcnow().isoformat()
+                },
+                **({
+                    'ConditionExpression': '#version = :version',
+                    'ExpressionAttributeNames': {'#version': 'version'},
+                    'ExpressionAttributeValues': {':version': current.get('version', 0)}
+                } if current is not None else {'ConditionExpression': 'attribute_not_exists(pk)'})
+            )
+            return
+        except Exception as e:
+            if dynamo_error_code(e) != 'ConditionalCheckFailedException':
+                raise
+            time.sleep(0.05 * (2 ** attempt))
+    raise RuntimeError(f'{view_key} update conflict')
+
+
+def handle_rebuild_materialized(event: dict) -> dict:
+    """구체화 항목 재생성 (관리자)"""
+    if not verify_auth(event):
+        return json_response(401, {'error': 'Unauthorized'})
+
+    try:
+        counts = {view_key: len(rebuild_materialized(view_key)) for view_key in MATERIALIZED_VIEWS}
+        bump_content_version()
+        return json_response(200, {'success': True, 'rebuilt': counts})
+    except Exception as e:
+        return json_response(500, {'error': str(e)})
+
+
 # ==========================================
 # 인증 API
 # ==========================================
@@ -274,7 +1213,7 @@ def handle_get_config(event: dict) -> dict:
         return json_response(401, {'error': 'Unauthorized'})
 
     try:
-        table = dynamodb.Table(TABLE_CONFIG)
+        table = get_table(TABLE_CONFIG)
         response = table.get_item(Key={'pk': 'ADMIN_CONFIG'})
         item = response.get('Item')
         if not item:
@@ -296,7 +1235,7 @@ def handle_update_config(body: dict, event: dict) -> dict:
         return json_response(401, {'error': 'Unauthorized'})
 
     try:
-        table = dynamodb.Table(TABLE_CONFIG)
+        table = get_table(TABLE_CONFIG)
         item = {
             'pk': 'ADMIN_CONFIG',
             'title': body.get('title', 'AI Civilization Atlas'),
@@ -315,19 +1254,38 @@ def handle_update_config(body: dict, event: dict) -> dict:
 # Timeline Events API
 # ==========================================
 
-def handle_get_events_public() -> dict:
-    """공개 이벤트 목록"""
+def handle_get_events_public(event: dict) -> dict:
+    """공개 이벤트 목록 (limit, cursor 페이지네이션, 첫 페이지는 컨테이너 캐시)"""
     try:
-        table = dynamodb.Table(TABLE_EVENTS)
-        response = table.scan(
-            FilterExpression='#status = :published',
-            ExpressionAttributeNames={'#status': 'status'},
-            ExpressionAttributeValues={':published': 'published'}
-        )
-        events = response.get('Items', [])
-        # 날짜순 정렬
-        events.sort(key=lambda x: x.get('date', ''), reverse=True)
-        return json_response(200, {'success': True, 'events': events})
+        limit, start_key = get_page_params(event)
+        check_cursor(start_key, 'date', EVENTS_STATUS_INDEX in _missing_indexes, status='published')
+    except ValueError as e:
+        return json_response(400, {'error': str(e)})
+
+    if start_key is None:
+        return cached_response(('events_public', limit), lambda: load_events_public(limit))
+    return load_events_public(limit, start_key)
+
+
+def load_events_public(limit: int, start_key: dict = None) -> dict:
+    """공개 이벤트 목록 조회"""
+    try:
+        view = MATERIALIZED_VIEWS['PUBLIC_TIMELINE']
+        materialized = read_materialized('PUBLIC_TIMELINE') if start_key is None and limit <= view['size'] else None
+        if materialized is not None:
+            # 첫 페이지는 구체화 항목에서 (GetItem 1회)
+            events = materialized[:limit]
+            has_more = len(materialized) > limit or len(materialized) == view['size']
+            last_key = index_key(events[-1], 'status', 'date') if events and has_more else None
+        else:
+            table = get_table(TABLE_EVENTS)
+            # 날짜순 정렬 (GSI 정렬키)
+            events, last_key = query_published(table, EVENTS_STATUS_INDEX, 'date', limit, start_key)
+        return json_response(200, {
+            'success': True,
+            'events': events,
+            'next_cursor': encode_cursor(last_key)
+        })
     except Exception as e:
         # DynamoDB 테이블이 없으면 정적 데이터 반환
         static_events = [
@@ -362,60 +1320,137 @@ def handle_get_events_public() -> dict:
                 "status": "published"
             }
         ]
-        return json_response(200, {'success': True, 'events': static_events})
+        return json_response(200, {'success': True, 'events': static_events, 'next_cursor': None})
 
 
 def handle_get_events(event: dict) -> dict:
-    """전체 이벤트 목록 (관리자)"""
+    """전체 이벤트 목록 (관리자, limit, cursor 페이지네이션)"""
     if not verify_auth(event):
         return json_response(401, {'error': 'Unauthorized'})
 
     try:
-        table = dynamodb.Table(TABLE_EVENTS)
-        response = table.scan()
-        events = response.get('Items', [])
-        events.sort(key=lambda x: x.get('date', ''), reverse=True)
-        return json_response(200, {'success': True, 'events': events})
+        limit, start_key = get_page_params(event)
+        check_cursor(start_key, 'date', scan=True)
+    except ValueError as e:
+        return json_response(400, {'error': str(e)})
+
+    try:
+        table = get_table(TABLE_EVENTS)
+        # 상태와 관계없이 전체를 읽어 날짜순으로 정렬한 뒤 커서 위치 다음부터 limit개
+        events, _ = read_pages(table.scan, {})
+        events, last_key = sort_page(events, 'date', limit, start_key)
+        return json_response(200, {
+            'success': True,
+            'events': events,
+            'next_cursor': encode_cursor(last_key)
+        })
     except Exception as e:
         return json_response(500, {'error': str(e)})
 
 
+def new_event_id() -> str:
+    """새 이벤트 ID (밀리초 시각 + 임의 접미사)
+
+    같은 초에 생성·일괄 등록이 겹쳐도 서로 덮어쓰지 않게 한다 (BatchWriteItem은 조건부 쓰기 불가).
+    """
+    return f"event_{datetime.utcnow().strftime('%Y%m%d%H%M%S%f')[:-3]}_{uuid.uuid4().hex[:8]}"
+
+
+def build_event_item(event_id: str, body: dict) -> dict:
+    """요청 본문으로 이벤트 항목 생성"""
+    return {
+        'pk': event_id,
+        'id': event_id,
+        'title': body.get('title', ''),
+        # GSI 정렬키는 빈 문자열을 허용하지 않으므로 생성일로 대체
+        'date': body.get('date') or datetime.utcnow().strftime('%Y-%m-%d'),
+        'period': body.get('period', ''),
+        'category': body.get('category', 'Civilization'),
+        'what_changed': body.get('what_changed', ''),
+        'why_it_matters': body.get('why_it_matters', ''),
+        'what_became_possible': body.get('what_became_possible', ''),
+        'next_transition_condition': body.get('next_transition_condition', ''),
+        'status': 'published',
+        'created_at': datetime.utcnow().isoformat()
+    }
+
+
 def handle_create_event(body: dict, event: dict) -> dict:
     """이벤트 생성"""
     if not verify_auth(event):
         return json_response(401, {'error': 'Unauthorized'})
 
     try:
-        table = dynamodb.Table(TABLE_EVENTS)
-        event_id = f"event_{datetime.utcnow().strftime('%Y%m%d%H%M%S')}"
-        item = {
-            'pk': event_id,
-            'id': event_id,
-            'title': body.get('title', ''),
-            'date': body.get('date', ''),
-            'period': body.get('period', ''),
-            'category': body.get('category', 'Civilization'),
-            'what_changed': body.get('what_changed', ''),
-            'why_it_matters': body.get('why_it_matters', ''),
-            'what_became_possible': body.get('what_became_possible', ''),
-            'next_transition_condition': body.get('next_transition_condition', ''),
-            'status': 'published',
-            'created_at': datetime.utcnow().isoformat()
-        }
+        table = get_table(TABLE_EVENTS)
+        event_id = new_event_id()
+        item = build_event_item(event_id, body)
         table.put_item(Item=item)
+        try:
+            update_materialized('PUBLIC_TIMELINE', [item])
+        except Exception as e:
+            print(f"Error updating PUBLIC_TIMELINE: {e}")
+        update_search_index([item], 'event')
+        bump_content_version()
         return json_response(200, {'success': True, 'event': item})
     except Exception as e:
         return json_response(500, {'error': str(e)})
 
 
+MAX_IMPORT_EVENTS = 500
+
+
+def handle_import_events(body: dict, event: dict) -> dict:
+    """이벤트 일괄 등록 (관리자, BatchWriteItem)"""
+    if not verify_auth(event):
+        return json_response(401, {'error': 'Unauthorized'})
+
+    events = body.get('events')
+    if not isinstance(events, list) or not events:
+        return json_response(400, {'error': 'events must be a non-empty list'})
+    if len(events) > MAX_IMPORT_EVENTS:
+        return json_response(400, {'error': f'Too many events (max {MAX_IMPORT_EVENTS})'})
+    invalid = [i for i, e in enumerate(events) if not isinstance(e, dict)]
+    if invalid:
+        # 일부만 등록하고 success를 돌려주지 않도록 전체 거절
+        return json_response(400, {'error': 'events must be JSON objects', 'invalid_indexes': invalid})
+
+    try:
+        prefix = new_event_id()
+        items = [build_event_item(f"{prefix}_{i:04d}", e) for i, e in enumerate(events)]
+        result = batch_write_items(TABLE_EVENTS, items)
+        if result['succeeded']:
+            imported = set(result['succeeded'])
+            imported_items = [item for item in items if item['pk'] in imported]
+            try:
+                update_materialized('PUBLIC_TIMELINE', imported_items)
+            except Exception as e:
+                print(f"Error updating PUBLIC_TIMELINE: {e}")
+            update_search_index(imported_items, 'event')
+            bump_content_version()
+        return json_response(200, {
+            'success': not result['failed'],
+            'imported': result['succeeded'],
+            'failed': result['failed']
+        })
+    except Exception as e:
+        return json_response(500, {'error': str(e)})
+
+
 def handle_delete_event(event_id: str, event: dict) -> dict:
     """이벤트 삭제"""
     if not verify_auth(event):
         return json_response(401, {'error': 'Unauthorized'})
 
     try:
-        table = dynamodb.Table(TABLE_EVENTS)
-        table.delete_item(Key={'pk': event_id})
+        table = get_table(TABLE_EVENTS)
+        deleted = table.delete_item(Key={'pk': event_id}, ReturnValues='ALL_OLD').get('Attributes')
+        try:
+            update_materialized('PUBLIC_TIMELINE', [], removed=[event_id])
+        except Exception as e:
+            print(f"Error updating PUBLIC_TIMELINE: {e}")
+        if deleted:
+            update_search_index([deleted], 'event', delete=True)
+        bump_content_version()
         return json_response(200, {'success': True})
     except Exception as e:
         return json_response(500, {'error': str(e)})
@@ -425,49 +1460,36 @@ def handle_delete_event(event_id: str, event: dict) -> dict:
 # Roadmaps API
 # ==========================================
 
-def handle_get_roadmaps() -> dict:
+def handle_get_roadmaps(event: dict) -> dict:
     """기술 로드맵 조회"""
-    return json_response(200, {
-        'success': True,
-        'roadmaps': list(TECHNOLOGY_ROADMAPS.values())
-    })
+    return static_response('roadmaps', event)
 
 
 # ==========================================
 # Irreversibles API
 # ==========================================
 
-def handle_get_irreversibles() -> dict:
+def handle_get_irreversibles(event: dict) -> dict:
     """되돌릴 수 없는 선택 목록"""
-    return json_response(200, {
-        'success': True,
-        'irreversibles': IRREVERSIBLE_CHOICES
-    })
+    return static_response('irreversibles', event)
 
 
 # ==========================================
 # Outlook API
 # ==========================================
 
-def handle_get_outlook() -> dict:
+def handle_get_outlook(event: dict) -> dict:
     """100년 전망"""
-    return json_response(200, {
-        'success': True,
-        'scenarios': SCENARIOS,
-        'epochs': EPOCHS
-    })
+    return static_response('outlook', event)
 
 
 # ==========================================
 # Governance API
 # ==========================================
 
-def handle_get_governance() -> dict:
+def handle_get_governance(event: dict) -> dict:
     """거버넌스 변화 모델"""
-    return json_response(200, {
-        'success': True,
-        'governance_shift': GOVERNANCE_SHIFT
-    })
+    return static_response('governance', event)
 
 
 # ==========================================
@@ -475,150 +1497,1345 @@ def handle_get_governance() -> dict:
 # ==========================================
 
 def handle_get_news_latest() -> dict:
-    """최신 뉴스 조회 (슬라이드용, 최대 8개)"""
+    """최신 뉴스 조회 (슬라이드용, 최대 8개, 컨테이너 캐시)"""
+    return cached_response('news_latest', load_news_latest)
+
+
+def load_news_latest() -> dict:
+    """최신 뉴스 8개 조회"""
     try:
-        table = dynamodb.Table(TABLE_NEWS)
-        response = table.scan(
-            FilterExpression='#status = :published',
-            ExpressionAttributeNames={'#status': 'status'},
-            ExpressionAttributeValues={':published': 'published'}
-        )
-        news_list = response.get('Items', [])
-        # 날짜순 정렬 (최신순)
-        news_list.sort(key=lambda x: x.get('created_at', ''), reverse=True)
-        # 최대 8개만 반환
-        return json_response(200, {'success': True, 'news': news_list[:8]})
+        news_list = read_materialized('LATEST_NEWS')
+        if news_list is None:
+            table = get_table(TABLE_NEWS)
+            # 최신순 최대 8개만 조회
+            news_list, _ = query_published(table, NEWS_STATUS_INDEX, 'created_at', limit=8)
+        return json_response(200, {'success': True, 'news': news_list})
     except Exception as e:
         # 테이블 없으면 샘플 데이터 반환
         sample_news = get_sample_news()
         return json_response(200, {'success': True, 'news': sample_news})
 
 
-def handle_get_news() -> dict:
-    """전체 뉴스 목록 조회"""
+def handle_get_news(event: dict) -> dict:
+    """전체 뉴스 목록 조회 (limit, cursor 페이지네이션, category / perspective / since 필터)"""
     try:
-        table = dynamodb.Table(TABLE_NEWS)
-        response = table.scan()
-        news_list = response.get('Items', [])
-        news_list.sort(key=lambda x: x.get('created_at', ''), reverse=True)
-        return json_response(200, {'success': True, 'news': news_list})
+        limit, start_key = get_page_params(event)
+        filters = get_news_filters(event)
+        index_name, partition_key, value = news_partition(filters)
+        check_cursor(start_key, 'created_at', index_name in _missing_indexes, **{partition_key: value})
+    except ValueError as e:
+        return json_response(400, {'error': str(e)})
+
+    try:
+        news_list, last_key = query_news(filters, limit, start_key)
+        return json_response(200, {
+            'success': True,
+            'news': news_list,
+            'next_cursor': encode_cursor(last_key)
+        })
     except Exception as e:
-        sample_news = get_sample_news()
-        return json_response(200, {'success': True, 'news': sample_news})
+        sample_news = filter_sample_news(filters)
+        return json_response(200, {'success': True, 'news': sample_news, 'next_cursor': None})
+
+
+def get_news_filters(event: dict) -> dict:
+    """쿼리스트링에서 category, perspective, since 추출 (잘못된 값은 ValueError)
+
+    반환: {'category': 'economy', 'perspective': 'Governance', 'since': ISO 시각} 중 지정된 것만
+    """
+    params = event.get('queryStringParameters') or {}
+    filters = {}
+    category = (params.get('category') or '').strip().lower()
+    if category:
+        if category not in NEWS_CATEGORIES:
+            raise ValueError('Invalid category')
+        filters['category'] = category
+    perspective = (params.get('perspective') or '').strip().capitalize()
+    if perspective:
+        if perspective not in NEWS_PERSPECTIVES:
+            raise ValueError('Invalid perspective')
+        filters['perspective'] = perspective
+    since = (params.get('since') or '').strip()
+    if since:
+        try:
+            moment = datetime.fromisoformat(since.replace('Z', '+00:00'))
+        except ValueError:
+            raise ValueError('Invalid since')
+        if moment.tzinfo is not None:
+            # created_at은 UTC naive ISO 문자열
+            moment = moment.astimezone(timezone.utc).replace(tzinfo=None)
+        filters['since'] = moment.isoformat()
+    return filters
+
+
+def news_index_attributes(category: str, perspective: str) -> dict:
+    """필터 GSI 키 속성 (게시된 항목에만 설정해 pending/failed는 인덱스에 들어가지 않음)"""
+    perspective = normalize_perspective(perspective)
+    return {
+        'pub_category': category,
+        'pub_perspective': perspective,
+        'pub_topic': f'{category}#{perspective}'
+    }
+
+
+def news_partition(filters: dict) -> tuple:
+    """필터 조건에 맞는 GSI 파티션
+
+    category / perspective가 있으면 해당 sparse GSI, 없으면 status GSI.
+    반환: (index_name, partition_key, value)
+    """
+    category, perspective = filters.get('category'), filters.get('perspective')
+    if category and perspective:
+        return NEWS_TOPIC_INDEX, 'pub_topic', f'{category}#{perspective}'
+    if category:
+        return NEWS_CATEGORY_INDEX, 'pub_category', category
+    if perspective:
+        return NEWS_PERSPECTIVE_INDEX, 'pub_perspective', perspective
+    return NEWS_STATUS_INDEX, 'status', 'published'
+
+
+def query_news(filters: dict, limit: int, start_key: dict = None) -> tuple:
+    """게시된 뉴스를 필터 조건의 GSI 파티션에서 키 범위(created_at >= since)로 최신순 조회
+
+    반환: (items, last_key)
+    """
+    index_name, partition_key, value = news_partition(filters)
+    return query_index(get_table(TABLE_NEWS), index_name, partition_key, value, 'created_at', limit, start_key,
+                       since=filters.get('since'))
+
+
+def filter_sample_news(filters: dict) -> list:
+    """샘플 뉴스에 필터 적용 (테이블이 없을 때)"""
+    return [
+        news for news in get_sample_news()
+        if news.get('category') == filters.get('category', news.get('category'))
+        and news.get('ai_perspective') == filters.get('perspective', news.get('ai_perspective'))
+    ]
+
+
+def backfill_news_index() -> int:
+    """필터 GSI 키 속성이 없는 기존 게시 뉴스에 속성 추가
+
+    반환: 갱신한 항목 수
+    """
+    table = get_table(TABLE_NEWS)
+    items, _ = read_pages(table.scan, {
+        'FilterExpression': '#status = :published AND attribute_not_exists(pub_topic)',
+        'ExpressionAttributeNames': {'#status': 'status'},
+        'ExpressionAttributeValues': {':published': 'published'}
+    })
+    for item in items:
+        attributes = news_index_attributes(item.get('category', 'science'), item.get('ai_perspective', 'Science'))
+        table.update_item(
+            Key={'pk': item['pk']},
+            UpdateExpression='SET pub_category = :pub_category, pub_perspective = :pub_perspective, '
+                             'pub_topic = :pub_topic',
+            ExpressionAttributeValues={':' + key: value for key, value in attributes.items()}
+        )
+    return len(items)
+
 
+def handle_collect_news(event: dict, context=None) -> dict:
+    """뉴스 수집 트리거 (EventBridge 또는 수동 호출)
 
-def handle_collect_news(event: dict) -> dict:
-    """뉴스 수집 트리거 (EventBridge 또는 수동 호출)"""
+    새 기사는 분석 대기(pending) 상태로 저장만 하고 바로 응답한다.
+    분석은 분석 작업자(/news/analyze 또는 worker_handler)가 처리한다.
+    """
     # 관리자 인증 또는 EventBridge 호출 확인
     is_scheduled = event.get('source') == 'aws.events'
     if not is_scheduled and not verify_auth(event):
         return json_response(401, {'error': 'Unauthorized'})
 
     try:
-        # 뉴스 수집 및 분석 실행
-        collected = collect_and_analyze_news()
+        result = collect_news(context)
+        queued = result['queued']
         return json_response(200, {
             'success': True,
-            'message': f'{len(collected)} news articles collected and analyzed',
-            'news': collected
+            'message': f'{len(queued)} news articles queued for analysis',
+            'queued': queued,
+            'duplicates': result['duplicates'],
+            'skipped_existing': result['skipped_existing'],
+            'writes': result['writes'],
+            'skipped_feeds': result['skipped_feeds'],
+            'not_modified_feeds': result['not_modified_feeds'],
+            'workers_triggered': result['workers_triggered'],
+            'deferred': {'feeds': result['deferred_feeds']}
         })
     except Exception as e:
         return json_response(500, {'error': str(e)})
 
 
-def collect_and_analyze_news() -> list:
-    """RSS 피드에서 뉴스 수집 및 Claude API로 분석"""
-    import urllib.request
+def handle_analyze_news(event: dict, context=None) -> dict:
+    """분석 대기 기사 분석 트리거 (EventBridge 또는 수동 호출)"""
+    is_scheduled = event.get('source') == 'aws.events'
+    if not is_scheduled and not verify_auth(event):
+        return json_response(401, {'error': 'Unauthorized'})
+
+    try:
+        result = analyze_pending_news(context)
+        published = result['published']
+        return json_response(200, {
+            'success': True,
+            'message': f'{len(published)} news articles analyzed and published',
+            'news': published,
+            'retrying': result['retrying'],
+            'deferred': result['deferred'],
+            'failed': result['failed'],
+            'remaining': result['remaining'],
+            'circuit_open': result['circuit_open'],
+            'cache': result['cache']
+        })
+    except Exception as e:
+        return json_response(500, {'error': str(e)})
+
+
+# news_sources.json을 읽을 수 없을 때 사용하는 기본 RSS 피드
+DEFAULT_RSS_FEEDS = [
+    {'url': 'https://www.technologyreview.com/topic/artificial-intelligence/feed/', 'category': 'science', 'source': 'MIT Tech Review', 'priority': 'high'},
+    {'url': 'https://www.theverge.com/ai-artificial-intelligence/rss/index.xml', 'category': 'tech', 'source': 'The Verge', 'priority': 'high'},
+    {'url': 'https://spectrum.ieee.org/feeds/topic/artificial-intelligence.rss', 'category': 'science', 'source': 'IEEE Spectrum', 'priority': 'high'},
+]
+
+# 우선순위별 폴링 간격 (시간). high는 매 실행마다 수집
+DEFAULT_POLL_INTERVAL_HOURS = {'high': 0, 'medium': 16, 'low': 24}
+POLL_SLACK_SECONDS = 15 * 60  # 스케줄 실행 시각 오차 허용
+
+# 컨테이너 수명 동안 유지되는 소스 설정
+_news_sources = None
+
+
+def load_news_sources() -> dict:
+    """news_sources.json에서 RSS가 있는 소스만 피드 목록으로 로드 (컨테이너당 1회)
+
+    반환: {'feeds': [...], 'poll_interval_hours': {...}}
+    """
+    global _news_sources
+    if _news_sources is None:
+        with init_span('news_sources'):
+            _news_sources = read_news_sources()
+    return _news_sources
+
+
+def read_news_sources() -> dict:
+    """news_sources.json 파싱 (실패 시 기본 피드)"""
+    try:
+        with open(NEWS_SOURCES_PATH, encoding='utf-8') as f:
+            config = json.load(f)
+        feeds = [
+            {
+                'url': source['rss'],
+                'category': source.get('category', 'science'),
+                'source': source['name'],
+                'lang': source.get('lang', 'en'),
+                'priority': source.get('priority', 'medium')
+            }
+            for source in config.get('sources', [])
+            if source.get('rss')
+        ]
+        intervals = {**DEFAULT_POLL_INTERVAL_HOURS, **config.get('poll_interval_hours', {})}
+    except Exception as e:
+        print(f"Error loading news sources ({NEWS_SOURCES_PATH}): {e}")
+        feeds, intervals = DEFAULT_RSS_FEEDS, dict(DEFAULT_POLL_INTERVAL_HOURS)
+    return {'feeds': feeds, 'poll_interval_hours': intervals}
+
+
+def feed_state_key(feed: dict) -> str:
+    """피드별 수집 상태 항목 키 (config 테이블)"""
+    return 'FEED#' + hashlib.sha256(feed['url'].encode('utf-8')).hexdigest()[:16]
+
+
+def load_feed_states(feeds: list) -> dict:
+    """피드별 수집 상태 조회 (BatchGetItem) -> {feed_state_key: item}"""
+    states = {}
+    keys = list({feed_state_key(feed) for feed in feeds})
+    for i in range(0, len(keys), 100):
+        request = {TABLE_CONFIG: {'Keys': [{'pk': key} for key in keys[i:i + 100]]}}
+        for attempt in range(5):
+            response = get_dynamodb().batch_get_item(RequestItems=request)
+            for item in response.get('Responses', {}).get(TABLE_CONFIG, []):
+                states[item['pk']] = item
+            request = response.get('UnprocessedKeys') or {}
+            if not request:
+                break
+            time.sleep(0.05 * (2 ** attempt))
+    return states
+
+
+def save_feed_state(feed: dict, **attrs) -> None:
+    """피드 수집 상태 갱신 (지정한 속성만 SET, None 값은 제외)"""
+    attrs = {name: value for name, value in attrs.items() if value is not None}
+    names = {f'#a{i}': name for i, name in enumerate(attrs)}
+    values = {f':v{i}': value for i, value in enumerate(attrs.values())}
+    get_table(TABLE_CONFIG).update_item(
+        Key={'pk': feed_state_key(feed)},
+        UpdateExpression='SET ' + ', '.join(f'#a{i} = :v{i}' for i in range(len(attrs))),
+        ExpressionAttributeNames=names,
+        ExpressionAttributeValues=values
+    )
+
+
+def select_due_feeds(feeds: list, states: dict, intervals: dict, now: datetime) -> list:
+    """우선순위별 폴링 간격이 지난 피드만 선택"""
+    due = []
+    for feed in feeds:
+        interval = float(intervals.get(feed.get('priority'), 0)) * 3600
+        last_polled = states.get(feed_state_key(feed), {}).get('last_polled')
+        if interval <= 0 or not last_polled:
+            due.append(feed)
+            continue
+        try:
+            elapsed = (now - datetime.fromisoformat(last_polled)).total_seconds()
+        except ValueError:
+            elapsed = interval
+        if elapsed >= interval - POLL_SLACK_SECONDS:
+            due.append(feed)
+    return due
+
+
+def get_deadline(context) -> float:
+    """Lambda 남은 실행 시간 기준 작업 마감 시각 (time.monotonic 기준)"""
+    if context is not None and hasattr(context, 'get_remaining_time_in_millis'):
+        budget = context.get_remaining_time_in_millis() / 1000
+    else:
+        budget = DEFAULT_COLLECT_BUDGET
+    return time.monotonic() + max(budget - COLLECT_SAFETY_MARGIN, 0)
+
+
+def time_left(deadline: float) -> float:
+    """마감까지 남은 시간 (초)"""
+    return max(deadline - time.monotonic(), 0)
+
+
+def run_bounded(fn, jobs: list, concurrency: int, deadline: float) -> tuple:
+    """jobs를 최대 concurrency개씩 병렬 실행, 마감까지 끝나지 않은 작업은 미완료로 반환
+
+    반환: (results, unfinished) - results는 (job, 결과 또는 예외) 목록
+    """
+    if not jobs:
+        return [], []
+    pool = ThreadPoolExecutor(max_workers=max(1, min(concurrency, len(jobs))))
+    futures = [(job, pool.submit(fn, job)) for job in jobs]
+    wait([f for _, f in futures], timeout=time_left(deadline))
+    results, unfinished = [], []
+    for job, future in futures:
+        if not future.done():
+            unfinished.append(job)
+        elif future.exception() is not None:
+            results.append((job, future.exception()))
+        else:
+            results.append((job, future.result()))
+    # 남은 작업은 취소하고 실행 중인 스레드는 기다리지 않음
+    pool.shutdown(wait=False, cancel_futures=True)
+    return results, unfinished
+
+
+FEED_ITEMS_PER_SOURCE = 3      # 소스당 최대 기사 수
+FEED_READ_CHUNK = 16 * 1024    # 스트리밍 파싱 시 한 번에 읽는 바이트
+ATOM_NAMESPACE = 'http://www.w3.org/2005/Atom'
+RSS_NAMESPACES = ('', 'http://purl.org/rss/1.0/')   # RSS 2.0 (네임스페이스 없음), RSS 1.0
+
+
+def parse_pub_date(text: str):
+    """RSS(RFC 822) / Atom(ISO 8601) 날짜를 UTC datetime으로 변환 (실패 시 None)"""
+    from email.utils import parsedate_to_datetime
+
+    if not text:
+        return None
+    text = text.strip()
+    try:
+        parsed = parsedate_to_datetime(text)
+    except (TypeError, ValueError):
+        try:
+            parsed = datetime.fromisoformat(text.replace('Z', '+00:00'))
+        except ValueError:
+            return None
+    if parsed.tzinfo is None:
+        parsed = parsed.replace(tzinfo=timezone.utc)
+    return parsed.astimezone(timezone.utc)
+
+
+def _entry_fields(elem) -> dict:
+    """RSS <item> / Atom <entry> 하위 요소에서 기사 필드 추출
+
+    RSS 요소는 네임스페이스 없이(또는 RSS 1.0), Atom 요소는 Atom 네임스페이스일 때만 인정한다.
+    <media:content>, <media:title> 같은 확장 요소는 무시한다.
+    필드마다 처음 나온 값을 쓰되, 빈 값은 뒤에 나온 값으로 대체한다.
+    """
+    fields = {}
+    for child in elem:
+        namespace, _, name = child.tag[1:].rpartition('}') if child.tag.startswith('{') else ('', '', child.tag)
+        if namespace in RSS_NAMESPACES:
+            key = {'title': 'title', 'link': 'link', 'description': 'description', 'pubDate': 'pub_date'}.get(name)
+        elif namespace == ATOM_NAMESPACE:
+            key = {'title': 'title', 'link': 'link', 'summary': 'description', 'content': 'description',
+                   'published': 'pub_date', 'updated': 'pub_date'}.get(name)
+        else:
+            continue
+        if key == 'link':
+            # Atom: <link rel="alternate" href="..."/>, RSS: <link>url</link>
+            if namespace == ATOM_NAMESPACE:
+                value = child.get('href') if child.get('rel', 'alternate') == 'alternate' else None
+            else:
+                value = child.text
+            if value and value.strip():
+                fields.setdefault('link', value.strip())
+        elif key and not fields.get(key):
+            fields[key] = child.text or ''
+    return fields
+
+
+def iter_feed_entries(stream, limit: int, since=None):
+    """응답 스트림을 조금씩 읽으며 RSS/Atom 항목을 순서대로 생성
+
+    limit개를 채우거나 since 이전(이미 본) 항목을 만나면 나머지 본문은 읽지 않는다.
+    """
     import xml.etree.ElementTree as ET
 
-    collected_news = []
+    parser = ET.XMLPullParser(events=('end',))
+    count = 0
+    while True:
+        chunk = stream.read(FEED_READ_CHUNK)
+        if chunk:
+            parser.feed(chunk)
+        else:
+            parser.close()
+        for _, elem in parser.read_events():
+            if elem.tag.rsplit('}', 1)[-1] not in ('item', 'entry'):
+                continue
+            fields = _entry_fields(elem)
+            elem.clear()  # 처리한 항목은 메모리에서 해제
+            published = parse_pub_date(fields.get('pub_date'))
+            if since is not None and published is not None and published <= since:
+                return
+            if 'title' not in fields or 'link' not in fields:
+                continue
+            fields['published'] = published
+            yield fields
+            count += 1
+            if count >= limit:
+                return
+        if not chunk:
+            return
+
+
+def fetch_feed(feed: dict, timeout: float = FEED_TIMEOUT, state: dict = None) -> dict:
+    """RSS/Atom 피드 하나를 가져와 새 기사 목록 추출 (소스당 최대 3개)
+
+    이전 수집의 ETag / Last-Modified로 조건부 요청을 보내고,
+    304 응답이면 본문을 받거나 파싱하지 않는다. 본문은 스트리밍으로 파싱하며
+    마지막으로 본 발행 시각(last_seen_pub) 이전 항목에 도달하면 읽기를 멈춘다.
+
+    반환: {'articles': [...], 'not_modified': bool, 'etag': str,
+           'last_modified': str, 'last_seen_pub': str}
+    """
+    import urllib.request
+    import urllib.error
+
+    state = state or {}
+    headers = {'User-Agent': 'Mozilla/5.0'}
+    if state.get('etag'):
+        headers['If-None-Match'] = state['etag']
+    if state.get('last_modified'):
+        headers['If-Modified-Since'] = state['last_modified']
+    since = parse_pub_date(state.get('last_seen_pub'))
+
+    # RSS 가져오기
+    req = urllib.request.Request(feed['url'], headers=headers)
+    try:
+        with timed_metric('FeedFetchLatency'), urllib.request.urlopen(req, timeout=timeout) as response:
+            etag = response.headers.get('ETag')
+            last_modified = response.headers.get('Last-Modified')
+            entries = list(iter_feed_entries(response, FEED_ITEMS_PER_SOURCE, since))
+    except urllib.error.HTTPError as e:
+        if e.code != 304:
+            raise
+        return {
+            'articles': [],
+            'not_modified': True,
+            'etag': e.headers.get('ETag') or state.get('etag'),
+            'last_modified': e.headers.get('Last-Modified') or state.get('last_modified'),
+            'last_seen_pub': state.get('last_seen_pub')
+        }
+
+    articles = []
+    for entry in entries:
+        articles.append({
+            'title': entry['title'],
+            'url': entry['link'],
+            'description': entry.get('description', '')[:500],
+            'source': feed['source'],
+            'category': feed['category'],
+            'pub_date': entry.get('pub_date', '')
+        })
+    seen = [entry['published'] for entry in entries if entry['published'] is not None]
+    if since is not None:
+        seen.append(since)
+    return {
+        'articles': articles,
+        'not_modified': False,
+        'etag': etag,
+        'last_modified': last_modified,
+        'last_seen_pub': max(seen).isoformat() if seen else None
+    }
 
-    # RSS 피드 목록 (실제 구현시 news_sources.json에서 로드)
-    rss_feeds = [
-        {'url': 'https://www.technologyreview.com/topic/artificial-intelligence/feed/', 'category': 'science', 'source': 'MIT Tech Review'},
-        {'url': 'https://www.theverge.com/ai-artificial-intelligence/rss/index.xml', 'category': 'tech', 'source': 'The Verge'},
-        {'url': 'https://spectrum.ieee.org/feeds/topic/artificial-intelligence.rss', 'category': 'science', 'source': 'IEEE Spectrum'},
-    ]
 
-    for feed in rss_feeds:
+def analyze_articles(articles: list, deadline: float) -> list:
+    """기사 묶음에 분석 결과 채우기 (배치 요청 후 실패한 기사만 단건 재요청)
+
+    분석하지 못한 기사에는 analysis_error를 남긴다.
+      'invalid'     - 응답이 잘못됨 (재시도 횟수에 포함)
+      'unavailable' - API 장애/회로 차단으로 요청하지 못함 (나중에 다시 분석)
+    """
+    # Claude API로 분석 (API 키가 있는 경우)
+    if ANTHROPIC_API_KEY:
         try:
-            # RSS 가져오기
-            req = urllib.request.Request(feed['url'], headers={'User-Agent': 'Mozilla/5.0'})
-            with urllib.request.urlopen(req, timeout=10) as response:
-                content = response.read()
-
-            # XML 파싱
-            root = ET.fromstring(content)
-            items = root.findall('.//item')[:3]  # 소스당 최대 3개
-
-            for item in items:
-                title = item.find('title')
-                link = item.find('link')
-                description = item.find('description')
-                pub_date = item.find('pubDate')
-
-                if title is not None and link is not None:
-                    article = {
-                        'title': title.text or '',
-                        'url': link.text or '',
-                        'description': (description.text or '')[:500] if description is not None else '',
-                        'source': feed['source'],
-                        'category': feed['category'],
-                        'pub_date': pub_date.text if pub_date is not None else ''
-                    }
-
-                    # Claude API로 분석 (API 키가 있는 경우)
-                    if ANTHROPIC_API_KEY:
-                        analysis = analyze_with_claude(article)
-                        article.update(analysis)
-                    else:
-                        # API 키 없으면 기본 분석
-                        article['summary'] = article['description'][:200] + '...' if len(article['description']) > 200 else article['description']
-                        article['ai_analysis'] = 'AI 분석을 위해 ANTHROPIC_API_KEY 설정이 필요합니다.'
-                        article['ai_comment'] = '"분석 대기 중입니다."'
-                        article['ai_perspective'] = 'Science'
-
-                    # DynamoDB에 저장
-                    save_news_to_db(article)
-                    collected_news.append(article)
+            if len(articles) > 1:
+                analyses = analyze_batch_with_claude(articles, min(CLAUDE_TIMEOUT, time_left(deadline)))
+            else:
+                analyses = [analyze_with_claude(articles[0], min(CLAUDE_TIMEOUT, time_left(deadline)))]
+        except ClaudeUnavailable as e:
+            print(f"Claude API unavailable: {e}")
+            analyses = [ClaudeUnavailable] * len(articles)
+
+        for article, analysis in zip(articles, analyses):
+            if analysis is None:
+                # 배치 단계에서 이미 캐시를 확인했으므로 바로 요청
+                try:
+                    analysis = analyze_with_claude(article, min(CLAUDE_TIMEOUT, time_left(deadline)), check_cache=False)
+                except ClaudeUnavailable:
+                    analysis = ClaudeUnavailable
+            if analysis is ClaudeUnavailable:
+                article['analysis_error'] = 'unavailable'
+            elif analysis is None:
+                article['analysis_error'] = 'invalid'
+            else:
+                article.update(analysis)
+    else:
+        # API 키 없으면 기본 분석
+        for article in articles:
+            article['summary'] = article['description'][:200] + '...' if len(article['description']) > 200 else article['description']
+            article['ai_analysis'] = 'AI 분석을 위해 ANTHROPIC_API_KEY 설정이 필요합니다.'
+            article['ai_comment'] = '"분석 대기 중입니다."'
+            article['ai_perspective'] = 'Science'
+    return articles
+
+
+def collect_news(context=None) -> dict:
+    """RSS 피드에서 새 기사를 수집해 분석 대기(status=pending) 항목으로 저장
+
+    피드는 제한된 동시성으로 병렬 수집하고, Lambda 남은 시간 안에 끝나지 않은
+    피드는 deferred로 보고한다. 분석 작업자 함수가 설정되어 있으면 비동기로 호출한다.
+    """
+    deadline = get_deadline(context)
+
+    # 폴링 주기가 돌아온 피드만 선택
+    sources = load_news_sources()
+    try:
+        feed_states = load_feed_states(sources['feeds'])
+    except Exception as e:
+        print(f"Error loading feed states: {e}")
+        feed_states = {}
+    started_at = datetime.utcnow()
+    due_feeds = select_due_feeds(sources['feeds'], feed_states, sources['poll_interval_hours'], started_at)
+
+    # 피드 병렬 수집
+    fetched, unfinished_feeds = run_bounded(
+        lambda feed: fetch_feed(
+            feed, min(FEED_TIMEOUT, time_left(deadline)), feed_states.get(feed_state_key(feed))
+        ),
+        due_feeds, FEED_FETCH_CONCURRENCY, deadline
+    )
+    articles = {}
+    not_modified = 0
+    polled = []
+    for feed, result in fetched:
+        if isinstance(result, Exception):
+            print(f"Error fetching {feed['url']}: {result}")
+            continue
+        polled.append((feed, result))
+        if result['not_modified']:
+            # 304: 변경 없음, 파싱/분석 생략
+            not_modified += 1
+            continue
+        for article in result['articles']:
+            # 같은 실행 안에서 여러 피드에 실린 기사는 한 번만 처리
+            articles.setdefault(news_id_for(article['url']), article)
 
+    # 이미 저장된 기사(분석 대기 포함)는 다시 넣지 않음
+    try:
+        existing = find_existing_news_ids(list(articles))
+    except Exception as e:
+        print(f"Error checking existing news: {e}")
+        existing = set()
+    pending = [build_pending_news_item(a) for news_id, a in articles.items() if news_id not in existing]
+
+    # 최근 기사와 같은 사건이면 묶음에 붙이고 대표 기사만 분석 대기로 남김
+    duplicates, signatures = [], []
+    if NEWS_DEDUP_MAX_DISTANCE >= 0 and pending:
+        try:
+            recent = load_recent_signatures()
         except Exception as e:
-            print(f"Error fetching {feed['url']}: {e}")
+            # 최근 서명을 못 읽으면 같은 실행 안의 중복만 묶음
+            print(f"Error loading news signatures: {e}")
+            recent = RecentSignatures(NEWS_DEDUP_MAX_DISTANCE)
+        pending, duplicates, signatures = cluster_pending_items(pending, recent)
+
+    # 분석 대기 + 중복 항목 일괄 저장 (BatchWriteItem)
+    try:
+        writes = batch_write_items(TABLE_NEWS, pending + duplicates)
+    except Exception as e:
+        print(f"Error saving news: {e}")
+        writes = {'succeeded': [], 'failed': [item['pk'] for item in pending + duplicates]}
+    saved = set(writes['succeeded'])
+
+    # 피드 상태(ETag, Last-Modified, last_seen_pub)는 기사 저장 후에 갱신
+    # 저장에 실패한 기사가 있는 피드는 갱신하지 않아 다음 실행에서 같은 기사를 다시 받음
+    unsaved = {item['pk'] for item in pending + duplicates} - saved
+    for feed, result in polled:
+        if any(news_id_for(article['url']) in unsaved for article in result['articles']):
+            print(f"Keeping feed state {feed['url']}: articles not saved")
             continue
+        try:
+            save_feed_state(
+                feed,
+                source=feed['source'],
+                last_polled=started_at.isoformat(),
+                etag=result['etag'],
+                last_modified=result['last_modified'],
+                last_seen_pub=result['last_seen_pub']
+            )
+        except Exception as e:
+            print(f"Error saving feed state {feed['url']}: {e}")
 
-    return collected_news
+    if signatures:
+        try:
+            save_signatures([entry for entry in signatures if entry['id'] in saved])
+        except Exception as e:
+            print(f"Error saving news signatures: {e}")
+        count_cluster_duplicates([item for item in duplicates if item['pk'] in saved])
 
+    claim_size = max(1, ANALYSIS_BATCH_SIZE) * max(1, ANALYSIS_CONCURRENCY)
+    workers = min(ANALYSIS_WORKERS, -(-sum(item['pk'] in saved for item in pending) // claim_size))
 
-def analyze_with_claude(article: dict) -> dict:
-    """Claude API로 뉴스 분석"""
-    import urllib.request
+    return {
+        'queued': [
+            {'id': item['pk'], 'title': item['title'], 'source': item['source']}
+            for item in pending if item['pk'] in saved
+        ],
+        'duplicates': [
+            {'id': item['pk'], 'title': item['title'], 'source': item['source'], 'cluster_id': item['cluster_id']}
+            for item in duplicates if item['pk'] in saved
+        ],
+        'skipped_existing': len(existing),
+        'writes': {
+            'succeeded': writes['succeeded'],
+            'failed': [
+                {'id': item['pk'], 'title': item['title'], 'url': item['original_url']}
+                for item in pending + duplicates if item['pk'] not in saved
+            ]
+        },
+        'skipped_feeds': len(sources['feeds']) - len(due_feeds),
+        'not_modified_feeds': not_modified,
+        'workers_triggered': trigger_analysis_workers(workers),
+        'deferred_feeds': [feed['source'] for feed in unfinished_feeds]
+    }
+
+
+# ==========================================
+# 유사 기사 묶기 (SimHash)
+# ==========================================
+# 같은 사건을 여러 매체가 다른 URL/제목으로 보도하면 URL 중복 제거로는 걸러지지 않는다.
+# 제목 + 설명의 SimHash가 최근 기사와 NEWS_DEDUP_MAX_DISTANCE 비트 이내로 가까우면
+# 같은 묶음(cluster_id = 대표 기사 ID)에 붙이고 status=duplicate로 저장해 분석하지 않는다.
+# 서명은 서로 다른 해시로 만든 64비트 SimHash 두 개(128비트)이고 두 쪽 모두 가까워야 같은 사건으로 본다.
+# 짧은 글은 64비트 하나로는 무관한 기사끼리도 가끔 가까워지기 때문이다.
+# 최근 서명(최대 NEWS_SIGNATURE_MAX개)과는 모두 직접 비교한다. 기본 거리 16에서 빠짐없이 찾는 LSH 구간은
+# 4비트 정도로 좁아져 후보를 거의 거르지 못하므로, 정수 XOR + 비트 수 세기 2000번이 더 싸다 (기사당 약 1ms).
+
+SIMHASH_BITS = 64                         # 서명 한쪽의 비트 수 (서명 전체는 두 배)
+SIMHASH_MASK = (1 << SIMHASH_BITS) - 1
+NEWS_SIGNATURES_KEY = 'NEWS_SIGNATURES'   # config 테이블의 최근 서명 항목
+
+
+def simhash_features(text: str) -> set:
+    """SimHash 특징: 영문 등은 3글자 이상 단어, 한국어 등은 단어 안의 두 글자"""
+    features = set()
+    for word in search_words(text):
+        if word.isascii():
+            if len(word) >= 3:
+                features.add(word)
+        else:
+            features.update(word_tokens(word) or [word])
+    return features
+
+
+def simhash(features: set) -> int:
+    """특징 집합의 128비트 서명 (64비트 SimHash 두 개를 이어 붙임, 특징이 없으면 0)"""
+    if not features:
+        return 0
+    hashes = [
+        format(int.from_bytes(hashlib.blake2b(feature.encode('utf-8'), digest_size=16).digest(), 'big'), '0128b')
+        for feature in features
+    ]
+    half = len(hashes) / 2
+    signature = 0
+    for column in zip(*hashes):
+        signature = (signature << 1) | (column.count('1') > half)
+    return signature
+
+
+class RecentSignatures:
+    """최근 기사 서명 목록 (비교 기준)"""
+
+    def __init__(self, max_distance: int):
+        self.max_distance = max_distance
+        self.entries = []
+
+    def add(self, entry: dict) -> None:
+        self.entries.append(entry)
+
+    def nearest(self, signature: int):
+        """두 SimHash 모두 거리 max_distance 이내인 기사 중 가장 가까운 것 (없으면 None)"""
+        best, best_distance = None, None
+        for entry in self.entries:
+            diff = signature ^ entry['signature']
+            low = bin(diff & SIMHASH_MASK).count('1')
+            if low > self.max_distance:
+                continue
+            high = bin(diff >> SIMHASH_BITS).count('1')
+            if high <= self.max_distance and (best is None or high + low < best_distance):
+                best, best_distance = entry, high + low
+        return best
+
+
+def load_recent_signatures() -> RecentSignatures:
+    """config 테이블의 최근 서명 목록 읽기"""
+    recent = RecentSignatures(NEWS_DEDUP_MAX_DISTANCE)
+    item = get_table(TABLE_CONFIG).get_item(Key={'pk': NEWS_SIGNATURES_KEY}, ConsistentRead=True).get('Item') or {}
+    cutoff = (datetime.utcnow() - timedelta(hours=NEWS_SIGNATURE_HOURS)).isoformat()
+    for news_id, signature, cluster_id, created_at in item.get('signatures', []):
+        if created_at < cutoff:
+            continue
+        recent.add({'id': news_id, 'signature': int(signature, 16), 'cluster_id': cluster_id, 'created_at': created_at})
+    return recent
+
+
+def cluster_pending_items(items: list, recent: RecentSignatures) -> tuple:
+    """분석 대기 항목을 최근 기사/같은 실행의 기사와 비교해 대표와 중복으로 나눔
+
+    중복은 status=duplicate, cluster_id=대표 기사 ID로 바꾸고 분석 입력(description)을 뺀다.
+    반환: (대표 항목 목록, 중복 항목 목록, 새 서명 목록)
+    """
+    representatives, duplicates, added = [], [], []
+    for item in items:
+        signature = simhash(simhash_features(f"{item['title']} {item.get('description', '')}"))
+        match = recent.nearest(signature) if signature else None
+        if match:
+            item.update(status='duplicate', cluster_id=match['cluster_id'])
+            for key in ('description', 'attempts'):
+                item.pop(key, None)
+            duplicates.append(item)
+        else:
+            item['cluster_id'] = item['pk']
+            representatives.append(item)
+        entry = {'id': item['pk'], 'signature': signature, 'cluster_id': item['cluster_id'],
+                 'created_at': item['created_at']}
+        if signature:
+            recent.add(entry)
+            added.append(entry)
+    return representatives, duplicates, added
+
+
+def save_signatures(added: list) -> None:
+    """새 서명을 최근 서명 항목에 병합 (NEWS_SIGNATURE_HOURS 이내, 최대 NEWS_SIGNATURE_MAX개)
+
+    version 조건부 쓰기, 충돌하면 다시 읽어 병합한다.
+    """
+    table = get_table(TABLE_CONFIG)
+    for attempt in range(5):
+        current = table.get_item(Key={'pk': NEWS_SIGNATURES_KEY}, ConsistentRead=True).get('Item') or {}
+        cutoff = (datetime.utcnow() - timedelta(hours=NEWS_SIGNATURE_HOURS)).isoformat()
+        known = {row[0] for row in current.get('signatures', [])}
+        rows = [row for row in current.get('signatures', []) if row[3] >= cutoff]
+        rows += [
+            [entry['id'], format(entry['signature'], '032x'), entry['cluster_id'], entry['created_at']]
+            for entry in added if entry['id'] not in known
+        ]
+        rows = sorted(rows, key=lambda row: row[3])[-NEWS_SIGNATURE_MAX:]
+        try:
+            table.put_item(
+                Item={
+                    'pk': NEWS_SIGNATURES_KEY,
+                    'signatures': rows,
+                    'version': current.get('version', 0) + 1,
+                    'updated_at': datetime.utcnow().isoformat()
+                },
+                **({
+                    'ConditionExpression': '#version = :version',
+                    'ExpressionAttributeNames': {'#version': 'version'},
+                    'ExpressionAttributeValues': {':version': current.get('version', 0)}
+                } if current else {'ConditionExpression': 'attribute_not_exists(pk)'})
+            )
+            return
+        except Exception as e:
+            if dynamo_error_code(e) != 'ConditionalCheckFailedException':
+                raise
+            time.sleep(0.05 * (2 ** attempt))
+    raise RuntimeError(f'{NEWS_SIGNATURES_KEY} update conflict')
+
+
+def count_cluster_duplicates(duplicates: list) -> None:
+    """저장된 중복 기사 수만큼 묶음 대표 기사의 duplicates(같은 사건 보도 수) 증가"""
+    counts = {}
+    for item in duplicates:
+        counts[item['cluster_id']] = counts.get(item['cluster_id'], 0) + 1
+    for cluster_id, count in counts.items():
+        try:
+            get_table(TABLE_NEWS).update_item(
+                Key={'pk': cluster_id},
+                UpdateExpression='ADD duplicates :count',
+                ConditionExpression='attribute_exists(pk)',
+                ExpressionAttributeValues={':count': count}
+            )
+        except Exception as e:
+            if dynamo_error_code(e) != 'ConditionalCheckFailedException':
+                print(f"Error updating cluster {cluster_id}: {e}")
+
+
+# ==========================================
+# 분석 작업자
+# ==========================================
+
+_lambda_client = None
+
+
+def trigger_analysis_workers(count: int) -> int:
+    """분석 작업자 Lambda를 count번 비동기 호출 (AIATLAS_ANALYSIS_WORKER_FUNCTION 설정 시)
+
+    반환: 호출에 성공한 수
+    """
+    global _lambda_client
+    if not ANALYSIS_WORKER_FUNCTION or count <= 0:
+        return 0
+    started = 0
+    try:
+        if _lambda_client is None:
+            import boto3
+            _lambda_client = boto3.client('lambda', region_name=DYNAMODB_REGION)
+        for _ in range(count):
+            _lambda_client.invoke(
+                FunctionName=ANALYSIS_WORKER_FUNCTION,
+                InvocationType='Event',
+                Payload=json.dumps({'source': 'aiatlas.worker'}).encode('utf-8')
+            )
+            started += 1
+    except Exception as e:
+        print(f"Error triggering analysis worker: {e}")
+    return started
+
+
+def claim_pending_news(limit: int) -> list:
+    """분석 대기 기사를 오래된 순으로 가져와 임대(lease_until) 설정
+
+    다른 작업자가 임대 중인 기사는 건너뛰고, 조건부 갱신으로 한 작업자만 가져가게 한다.
+    임대 시간이 지나면 (작업자 중단 등) 다시 가져갈 수 있다.
+    """
+    table = get_table(TABLE_NEWS)
+    now = int(time.time())
+    available = 'attribute_not_exists(lease_until) OR lease_until < :now'
+    candidates, _ = query_by_status(
+        table, NEWS_STATUS_INDEX, 'created_at', 'pending', limit=limit, newest_first=False,
+        filter_expression=available, filter_values={':now': now}
+    )
+
+    claimed = []
+    for item in candidates:
+        try:
+            table.update_item(
+                Key={'pk': item['pk']},
+                UpdateExpression='SET lease_until = :lease',
+                ConditionExpression=f'#status = :pending AND ({available})',
+                ExpressionAttributeNames={'#status': 'status'},
+                ExpressionAttributeValues={
+                    ':pending': 'pending',
+                    ':now': now,
+                    ':lease': now + ANALYSIS_LEASE_SECONDS
+                }
+            )
+            claimed.append(item)
+        except Exception as e:
+            if dynamo_error_code(e) != 'ConditionalCheckFailedException':
+                print(f"Error claiming {item['pk']}: {e}")
+    return claimed
+
+
+def article_from_item(item: dict) -> dict:
+    """분석 대기 항목을 분석 입력 형식으로 변환"""
+    return {
+        'title': item.get('title', ''),
+        'url': item.get('original_url', ''),
+        'description': item.get('description', ''),
+        'source': item.get('source', ''),
+        'category': item.get('category', 'science'),
+        'pub_date': item.get('pub_date', '')
+    }
+
+
+def publish_news_item(item: dict, analysis: dict) -> dict:
+    """분석 결과를 채우고 published로 전환 (임대 해제)
+
+    반환: 게시된 항목
+    """
+    now = datetime.utcnow().isoformat()
+    index_attributes = news_index_attributes(item.get('category', 'science'), analysis['ai_perspective'])
+    get_table(TABLE_NEWS).update_item(
+        Key={'pk': item['pk']},
+        UpdateExpression=(
+            'SET summary = :summary, ai_analysis = :ai_analysis, ai_comment = :ai_comment, '
+            'ai_perspective = :ai_perspective, #status = :published, published_at = :now, '
+            'pub_category = :pub_category, pub_perspective = :pub_perspective, pub_topic = :pub_topic '
+            'REMOVE lease_until, description'
+        ),
+        ConditionExpression='#status = :pending',
+        ExpressionAttributeNames={'#status': 'status'},
+        ExpressionAttributeValues={
+            ':summary': analysis['summary'],
+            ':ai_analysis': analysis['ai_analysis'],
+            ':ai_comment': analysis['ai_comment'],
+            ':ai_perspective': analysis['ai_perspective'],
+            ':published': 'published',
+            ':pending': 'pending',
+            ':now': now,
+            **{':' + key: value for key, value in index_attributes.items()}
+        }
+    )
+    published = {key: value for key, value in item.items() if key not in ('lease_until', 'description')}
+    published.update({field: analysis[field] for field in ('summary', 'ai_analysis', 'ai_comment', 'ai_perspective')})
+    published.update(status='published', published_at=now, **index_attributes)
+    return published
+
+
+def release_news_item(item: dict, failed: bool) -> bool:
+    """임대 해제 (실패면 시도 횟수 증가, 한도를 넘으면 status=failed)
+
+    반환: failed 상태로 전환했으면 True
+    """
+    attempts = int(item.get('attempts', 0)) + (1 if failed else 0)
+    give_up = attempts >= ANALYSIS_MAX_ATTEMPTS
+    values = {':attempts': attempts, ':pending': 'pending'}
+    update = 'SET attempts = :attempts'
+    if give_up:
+        update += ', #status = :failed'
+        values[':failed'] = 'failed'
+    try:
+        get_table(TABLE_NEWS).update_item(
+            Key={'pk': item['pk']},
+            UpdateExpression=update + ' REMOVE lease_until',
+            ConditionExpression='#status = :pending',
+            ExpressionAttributeNames={'#status': 'status'},
+            ExpressionAttributeValues=values
+        )
+    except Exception as e:
+        print(f"Error releasing {item['pk']}: {e}")
+    return give_up
+
+
+def analyze_pending_news(context=None) -> dict:
+    """분석 대기 기사를 묶음 단위로 가져와 분석 후 게시 (Lambda 남은 시간 동안 반복)
+
+    여러 작업자가 동시에 실행되어도 임대로 같은 기사를 중복 분석하지 않는다.
+    마감까지 끝나지 않은 기사는 임대만 해제해 다음 작업자가 가져가게 한다.
+    """
+    deadline = get_deadline(context)
+    cache_before = analysis_cache.stats()
+    batch_size = max(1, ANALYSIS_BATCH_SIZE)
+    claim_size = batch_size * max(1, ANALYSIS_CONCURRENCY)
+
+    published, failed = [], []
+    retrying = deferred = 0
+    remaining = circuit_open = False
+    while True:
+        if time_left(deadline) <= 0:
+            remaining = True
+            break
+        claimed = claim_pending_news(claim_size)
+        if not claimed:
+            break
+        batches = [claimed[i:i + batch_size] for i in range(0, len(claimed), batch_size)]
+        analyzed, unfinished = run_bounded(
+            lambda batch: analyze_articles([article_from_item(item) for item in batch], deadline),
+            batches, ANALYSIS_CONCURRENCY, deadline
+        )
+
+        for batch in unfinished:
+            for item in batch:
+                release_news_item(item, failed=False)
+        for batch, result in analyzed:
+            if isinstance(result, Exception):
+                print(f"Error analyzing batch of {len(batch)}: {result}")
+                result = [{'analysis_error': 'invalid'}] * len(batch)
+            for item, article in zip(batch, result):
+                error = article.get('analysis_error')
+                if error == 'unavailable':
+                    # API 장애: 시도 횟수에 넣지 않고 대기 상태로 되돌림
+                    release_news_item(item, failed=False)
+                    deferred += 1
+                    continue
+                if error is None:
+                    try:
+                        published.append(publish_news_item(item, article))
+                        continue
+                    except Exception as e:
+                        print(f"Error publishing {item['pk']}: {e}")
+                # 분석/게시 실패: 시도 횟수를 늘려 다시 대기시키거나 failed로 전환
+                if release_news_item(item, failed=True):
+                    failed.append({'id': item['pk'], 'title': item.get('title', '')})
+                else:
+                    retrying += 1
+        if unfinished:
+            remaining = True
+            break
+        if not claude_client.available():
+            # 회로 차단 중에는 남은 시간을 쓰지 않고 종료 (다음 스케줄에서 재개)
+            circuit_open = True
+            break
+
+    if published:
+        try:
+            update_materialized('LATEST_NEWS', published)
+        except Exception as e:
+            print(f"Error updating LATEST_NEWS: {e}")
+        update_search_index(published, 'news')
+        bump_content_version()
+
+    # 시간 안에 다 못 끝냈으면 다음 작업자에게 이어서 맡김
+    if remaining:
+        trigger_analysis_workers(1)
+
+    return {
+        'published': published,
+        'retrying': retrying,
+        'deferred': deferred,
+        'failed': failed,
+        'remaining': remaining,
+        'circuit_open': circuit_open,
+        'cache': {
+            name: count - cache_before[name]
+            for name, count in analysis_cache.stats().items()
+        }
+    }
+
+
+def worker_handler(event: dict, context) -> dict:
+    """분석 작업자 진입점 (비동기 호출 / 스케줄 / 별도 Lambda 핸들러로 사용)
+
+    handler()를 거치지 않으므로 요청과 같은 방식으로 지표를 수집한다 (Route=worker).
+    """
+    metrics_begin()
+    set_metric_property('Route', 'worker')
+    response = None
+    try:
+        result = analyze_pending_news(context)
+        summary = {
+            'published': len(result['published']),
+            'retrying': result['retrying'],
+            'deferred': result['deferred'],
+            'failed': len(result['failed']),
+            'remaining': result['remaining'],
+            'circuit_open': result['circuit_open']
+        }
+        print(json.dumps({'message': 'aiatlas analysis worker', **summary}))
+        response = {'statusCode': 200}
+        return summary
+    finally:
+        metrics_end(response)
+        report_init_timing()
+
+
+class AnalysisCache:
+    """LLM 분석 결과 캐시 (model, prompt) 해시 -> 분석 결과
+
+    프로세스 내 LRU를 먼저 확인하고, 없으면 DynamoDB(운영) 또는 SQLite(로컬 테스트)
+    저장소를 조회한다. 항목은 TTL이 지나면 만료된다. 저장소 오류는 캐시 미스로 처리한다.
+    """
+
+    def __init__(self, backend: str, ttl: int, lru_size: int, path: str = None):
+        self.backend = backend
+        self.ttl = ttl
+        self.lru_size = lru_size
+        self.path = path
+        self.hits = 0
+        self.misses = 0
+        self._lru = OrderedDict()
+        self._lock = threading.Lock()
+        self._sqlite = None
+
+    @staticmethod
+    def key_for(model: str, prompt: str) -> str:
+        return hashlib.sha256(f"{model}\n{prompt}".encode('utf-8')).hexdigest()
+
+    def stats(self) -> dict:
+        return {'hits': self.hits, 'misses': self.misses}
+
+    def get(self, key: str):
+        now = time.time()
+        with self._lock:
+            entry = self._lru.get(key)
+            if entry and entry[1] > now:
+                self._lru.move_to_end(key)
+                self.hits += 1
+                return dict(entry[0])
+
+        try:
+            value, expires_at = self._load(key)
+        except Exception as e:
+            print(f"Analysis cache read error: {e}")
+            value, expires_at = None, 0
+
+        with self._lock:
+            if value is not None and expires_at > now:
+                self._remember(key, value, expires_at)
+                self.hits += 1
+                return dict(value)
+            self.misses += 1
+            return None
+
+    def put(self, key: str, value: dict) -> None:
+        expires_at = time.time() + self.ttl
+        with self._lock:
+            self._remember(key, value, expires_at)
+        try:
+            self._store(key, value, expires_at)
+        except Exception as e:
+            print(f"Analysis cache write error: {e}")
+
+    def _remember(self, key: str, value: dict, expires_at: float) -> None:
+        self._lru[key] = (dict(value), expires_at)
+        self._lru.move_to_end(key)
+        while len(self._lru) > self.lru_size:
+            self._lru.popitem(last=False)
+
+    def _load(self, key: str) -> tuple:
+        if self.backend == 'dynamodb':
+            item = get_table(TABLE_LLM_CACHE).get_item(Key={'pk': key}).get('Item')
+            if item:
+                return json.loads(item['analysis']), int(item['expires_at'])
+        elif self.backend == 'sqlite':
+            with self._lock:
+                row = self._db().execute(
+                    'SELECT value, expires_at FROM llm_cache WHERE key = ?', (key,)
+                ).fetchone()
+            if row:
+                return json.loads(row[0]), row[1]
+        return None, 0
+
+    def _store(self, key: str, value: dict, expires_at: float) -> None:
+        raw = dumps_json(value)
+        if self.backend == 'dynamodb':
+            # expires_at은 DynamoDB TTL 속성으로 지정 (만료 항목 자동 삭제)
+            get_table(TABLE_LLM_CACHE).put_item(Item={
+                'pk': key,
+                'analysis': raw,
+                'expires_at': int(expires_at)
+            })
+        elif self.backend == 'sqlite':
+            with self._lock:
+                db = self._db()
+                db.execute('INSERT OR REPLACE INTO llm_cache VALUES (?, ?, ?)', (key, raw, expires_at))
+                db.commit()
+
+    def _db(self):
+        """SQLite 연결 (최초 사용 시 생성, 만료 항목 정리)"""
+        if self._sqlite is None:
+            import sqlite3
+            self._sqlite = sqlite3.connect(self.path, check_same_thread=False)
+            self._sqlite.execute(
+                'CREATE TABLE IF NOT EXISTS llm_cache (key TEXT PRIMARY KEY, value TEXT, expires_at REAL)'
+            )
+            self._sqlite.execute('DELETE FROM llm_cache WHERE expires_at < ?', (time.time(),))
+            self._sqlite.commit()
+        return self._sqlite
+
+
+analysis_cache = AnalysisCache(LLM_CACHE_BACKEND, LLM_CACHE_TTL, LLM_CACHE_LRU_SIZE, LLM_CACHE_PATH)
+
+
+ANALYSIS_FIELDS = """    "summary": "기사의 핵심 내용 2-3문장 요약",
+    "ai_analysis": "AI 관점에서의 분석 3-4문장. 이 사건이 AI 발전에 미치는 영향, 문명적 의미, 인간-AI 관계 변화 시사점",
+    "ai_comment": "AI 입장에서 한마디 논평 (따옴표 포함, 예: \\"인간들이 드디어...\\")",
+    "ai_perspective": "Civilization 또는 Science 또는 Industry 또는 Governance 중 하나\""""
+
+
+def clean_text(text: str) -> str:
+    """공백 정규화 (공백 차이만 있는 기사는 같은 프롬프트가 되도록)"""
+    return ' '.join((text or '').split())
 
-    prompt = f"""당신은 AI 문명 관측소의 분석가입니다.
+
+def build_analysis_prompt(article: dict) -> str:
+    """단건 분석 프롬프트 생성"""
+    return f"""당신은 AI 문명 관측소의 분석가입니다.
 아래 뉴스 기사를 읽고 AI 관점에서 분석해주세요.
 
 [기사 제목]
-{article['title']}
+{clean_text(article['title'])}
 
 [기사 내용]
-{article['description']}
+{clean_text(article['description'])}
 
 다음 JSON 형식으로만 응답해주세요 (다른 텍스트 없이):
 {{
-    "summary": "기사의 핵심 내용 2-3문장 요약",
-    "ai_analysis": "AI 관점에서의 분석 3-4문장. 이 사건이 AI 발전에 미치는 영향, 문명적 의미, 인간-AI 관계 변화 시사점",
-    "ai_comment": "AI 입장에서 한마디 논평 (따옴표 포함, 예: \"인간들이 드디어...\")",
-    "ai_perspective": "Civilization 또는 Science 또는 Industry 또는 Governance 중 하나"
+{ANALYSIS_FIELDS}
 }}"""
 
-    try:
+
+def build_batch_prompt(articles: list) -> str:
+    """여러 기사를 한 번에 분석하는 프롬프트 생성 (공통 지시문은 한 번만)"""
+    sections = '\n\n'.join(
+        f"[기사 {i}]\n제목: {clean_text(a['title'])}\n내용: {clean_text(a['description'])}"
+        for i, a in enumerate(articles)
+    )
+    return f"""당신은 AI 문명 관측소의 분석가입니다.
+아래 {len(articles)}개의 뉴스 기사를 각각 읽고 AI 관점에서 분석해주세요.
+
+{sections}
+
+기사마다 하나씩, 다음 형식의 객체를 담은 JSON 배열로만 응답해주세요 (다른 텍스트 없이).
+index는 기사 번호입니다:
+[
+  {{
+    "index": 0,
+{ANALYSIS_FIELDS}
+  }}
+]"""
+
+
+def validate_analysis(analysis) -> dict:
+    """분석 결과 형식 검증 (필수 필드가 모두 문자열이면 정리된 dict, 아니면 None)
+
+    ai_perspective는 NEWS_PERSPECTIVES 중 하나로 맞춘다 (필터 GSI 파티션 키가 됨).
+    """
+    if not isinstance(analysis, dict):
+        return None
+    fields = ('summary', 'ai_analysis', 'ai_comment', 'ai_perspective')
+    if not all(isinstance(analysis.get(name), str) for name in fields):
+        return None
+    result = {name: analysis[name] for name in fields}
+    result['ai_perspective'] = normalize_perspective(result['ai_perspective'])
+    return result
+
+
+def normalize_perspective(value: str) -> str:
+    """관점 문자열 -> NEWS_PERSPECTIVES 값 (대소문자 무시)
+
+    "science", "Science 관점"처럼 하나만 들어 있으면 그 값, 없거나 여러 개면 기본값 Science.
+    """
+    value = (value or '').strip()
+    for perspective in NEWS_PERSPECTIVES:
+        if value.lower() == perspective.lower():
+            return perspective
+    found = [p for p in NEWS_PERSPECTIVES if re.search(rf'\b{p}\b', value, re.IGNORECASE)]
+    return found[0] if len(found) == 1 else 'Science'
+
+
+class ClaudeUnavailable(Exception):
+    """Claude API를 지금 쓸 수 없음 (회로 차단, 호출 제한 대기 초과, 재시도 소진)
+
+    분석 실패가 아니라 나중에 다시 분석해야 하는 상태로 처리한다.
+    """
+
+
+CLAUDE_REJECTED_STATUS = (401, 403, 404)
+
+
+class ClaudeClient:
+    """Claude Messages API 클라이언트 (컨테이너 내 스레드 공유)
+
+    - 토큰 버킷으로 분당 요청 수 제한 (버스트 허용)
+    - 429 / 5xx / 네트워크 오류는 retry-after(없으면 지수 백오프)를 지켜 재시도
+    - 401 / 403 / 404 (키·모델 문제)는 재시도 없이 실패로 세고 ClaudeUnavailable
+    - 연속 실패가 임계값에 도달하면 cooldown 동안 호출하지 않고 바로 ClaudeUnavailable,
+      cooldown 후에는 요청 1건만 시험으로 보내 성공하면 회복
+    """
+
+    def __init__(self, requests_per_minute: float, burst: int, max_retries: int,
+                 breaker_threshold: int, breaker_cooldown: float):
+        self.rate = max(requests_per_minute, 0.001) / 60
+        self.capacity = max(1, burst)
+        self.max_retries = max_retries
+        self.breaker_threshold = max(1, breaker_threshold)
+        self.breaker_cooldown = breaker_cooldown
+        self._tokens = float(self.capacity)
+        self._refilled_at = time.monotonic()
+        self._paused_until = 0.0
+        self._failures = 0
+        self._open_until = 0.0
+        self._probing = False
+        self._lock = threading.Lock()
+
+    def available(self) -> bool:
+        """회로가 닫혀 있거나 시험 요청을 보낼 수 있는 상태인지"""
+        with self._lock:
+            return self._open_until <= time.monotonic() and not self._probing
+
+    def call(self, prompt: str, max_tokens: int, timeout: float) -> str:
+        """응답 텍스트 반환, timeout은 재시도와 호출 제한 대기를 포함한 전체 시간"""
+        import urllib.error
+
+        give_up_at = time.monotonic() + timeout
+        for attempt in range(self.max_retries + 1):
+            self._before_call()
+            try:
+                self._acquire(give_up_at)
+                text = self._send(prompt, max_tokens, min(CLAUDE_TIMEOUT, give_up_at - time.monotonic()))
+            except urllib.error.HTTPError as e:
+                if e.code in CLAUDE_REJECTED_STATUS:
+                    # 키 폐기/권한 없음/모델 중단 - 재시도해도 같고 기사 문제도 아니므로 장애로 처리
+                    self._after_call(success=False)
+                    add_metric('AnthropicRejected', 1)
+                    raise ClaudeUnavailable(f'Claude API rejected request: HTTP {e.code}')
+                if e.code != 429 and e.code < 500:
+                    # 요청 자체의 문제 (400 등) - 상류 장애가 아니므로 차단 대상 아님
+                    self._after_call(success=True)
+                    raise
+                self._after_call(success=False)
+                add_metric('AnthropicThrottled' if e.code == 429 else 'AnthropicServerErrors', 1)
+                wait = self._retry_after(e.headers) or 2 ** attempt
+                if e.code == 429:
+                    # 호출 제한은 다른 스레드의 요청도 함께 멈춤
+                    with self._lock:
+                        self._paused_until = max(self._paused_until, time.monotonic() + wait)
+                error = e
+            except ClaudeUnavailable:
+                self._after_call(success=None)
+                raise
+            except (urllib.error.URLError, OSError) as e:
+                self._after_call(success=False)
+                wait = 2 ** attempt
+                error = e
+            except Exception:
+                # 응답은 받았지만 형식이 잘못됨 - 호출자가 분석 실패로 처리
+                self._after_call(success=True)
+                raise
+            else:
+                self._after_call(success=True)
+                return text
+
+            if attempt == self.max_retries or time.monotonic() + wait >= give_up_at:
+                break
+            time.sleep(wait)
+        raise ClaudeUnavailable(f'Claude API unavailable: {error}')
+
+    def _send(self, prompt: str, max_tokens: int, timeout: float) -> str:
+        import urllib.request
+
         data = json.dumps({
-            "model": "claude-3-haiku-20240307",
-            "max_tokens": 1024,
+            "model": CLAUDE_MODEL,
+            "max_tokens": max_tokens,
             "messages": [{"role": "user", "content": prompt}]
         }).encode('utf-8')
 
         req = urllib.request.Request(
-            'https://api.anthropic.com/v1/messages',
+            ANTHROPIC_API_URL,
             data=data,
             headers={
                 'Content-Type': 'application/json',
@@ -627,81 +2844,265 @@ def analyze_with_claude(article: dict) -> dict:
             }
         )
 
-        with urllib.request.urlopen(req, timeout=30) as response:
+        with timed_metric('AnthropicLatency'), urllib.request.urlopen(req, timeout=max(timeout, 0.1)) as response:
             result = json.loads(response.read())
-            content = result['content'][0]['text']
-            # JSON 파싱
-            analysis = json.loads(content)
-            return analysis
+            return result['content'][0]['text']
+
+    def _before_call(self) -> None:
+        """회로 상태 확인 (열려 있으면 ClaudeUnavailable)"""
+        with self._lock:
+            now = time.monotonic()
+            if self._open_until > now:
+                add_metric('AnthropicCircuitOpen', 1)
+                raise ClaudeUnavailable('Claude API circuit open')
+            if self._failures >= self.breaker_threshold:
+                # cooldown 후 시험 요청은 1건만
+                if self._probing:
+                    raise ClaudeUnavailable('Claude API circuit half-open')
+                self._probing = True
+
+    def _after_call(self, success) -> None:
+        """호출 결과 반영 (success=None이면 호출하지 않은 것으로 보고 시험 상태만 해제)"""
+        with self._lock:
+            self._probing = False
+            if success is None:
+                return
+            if success:
+                self._failures = 0
+                return
+            self._failures += 1
+            if self._failures >= self.breaker_threshold:
+                self._open_until = time.monotonic() + self.breaker_cooldown
+                print(f"Claude API circuit opened after {self._failures} consecutive failures")
+
+    def _acquire(self, give_up_at: float) -> None:
+        """토큰 1개 획득 (give_up_at까지 못 얻으면 ClaudeUnavailable)"""
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._tokens = min(self.capacity, self._tokens + (now - self._refilled_at) * self.rate)
+                self._refilled_at = now
+                if now >= self._paused_until and self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                wait = max(self._paused_until - now, (1 - self._tokens) / self.rate, 0.01)
+            if time.monotonic() + wait >= give_up_at:
+                raise ClaudeUnavailable('Claude API rate limit wait exceeds timeout')
+            time.sleep(wait)
+
+    @staticmethod
+    def _retry_after(headers) -> float:
+        """retry-after 헤더 (초 또는 HTTP 날짜) -> 대기 초, 없으면 0"""
+        from email.utils import parsedate_to_datetime
+
+        value = (headers or {}).get('retry-after') if headers is not None else None
+        if not value:
+            return 0
+        try:
+            return max(float(value), 0)
+        except ValueError:
+            pass
+        try:
+            return max(parsedate_to_datetime(value).timestamp() - time.time(), 0)
+        except (TypeError, ValueError):
+            return 0
+
+
+claude_client = ClaudeClient(
+    CLAUDE_REQUESTS_PER_MINUTE, CLAUDE_BURST, CLAUDE_MAX_RETRIES,
+    CLAUDE_BREAKER_THRESHOLD, CLAUDE_BREAKER_COOLDOWN
+)
+
+
+def call_claude(prompt: str, max_tokens: int, timeout: float) -> str:
+    """Claude Messages API 호출, 응답 텍스트 반환 (호출 제한 / 재시도 / 회로 차단 적용)"""
+    return claude_client.call(prompt, max_tokens, timeout)
+
+
+def analyze_with_claude(article: dict, timeout: float = CLAUDE_TIMEOUT, check_cache: bool = True) -> dict:
+    """Claude API로 뉴스 분석 (캐시 우선)
+
+    반환: 분석 결과, 응답이 잘못되었으면 None. API를 쓸 수 없으면 ClaudeUnavailable
+    """
+    prompt = build_analysis_prompt(article)
+    cache_key = AnalysisCache.key_for(CLAUDE_MODEL, prompt)
+    if check_cache:
+        cached = analysis_cache.get(cache_key)
+        if cached is not None:
+            return cached
+
+    try:
+        # JSON 파싱
+        analysis = validate_analysis(json.loads(call_claude(prompt, 1024, timeout)))
+        if analysis is None:
+            raise ValueError('Invalid analysis format')
+        analysis_cache.put(cache_key, analysis)
+        return analysis
+    except ClaudeUnavailable:
+        raise
     except Exception as e:
         print(f"Claude API error: {e}")
-        return {
-            'summary': article['description'][:200],
-            'ai_analysis': 'AI 분석 중 오류가 발생했습니다.',
-            'ai_comment': '"분석 실패"',
-            'ai_perspective': 'Science'
-        }
+        return None
+
+
+def analyze_batch_with_claude(articles: list, timeout: float = CLAUDE_TIMEOUT) -> list:
+    """여러 기사를 한 번의 요청으로 분석
+
+    반환: 기사 순서대로 분석 결과 목록. 캐시에 없고 응답에서 파싱/검증에
+    실패한 기사는 None (호출자가 단건 요청으로 재시도). API를 쓸 수 없으면 ClaudeUnavailable
+    """
+    results = [None] * len(articles)
+    misses = []
+    for i, article in enumerate(articles):
+        cache_key = AnalysisCache.key_for(CLAUDE_MODEL, build_analysis_prompt(article))
+        cached = analysis_cache.get(cache_key)
+        if cached is not None:
+            results[i] = cached
+        else:
+            misses.append((i, cache_key))
+    if len(misses) < 2:
+        return results
+
+    batch = [articles[i] for i, _ in misses]
+    try:
+        content = call_claude(build_batch_prompt(batch), min(1024 * len(batch), 4096), timeout)
+        # 배열 앞뒤에 다른 텍스트가 붙은 경우 대비
+        parsed = json.loads(content[content.find('['):content.rfind(']') + 1])
+    except ClaudeUnavailable:
+        raise
+    except Exception as e:
+        print(f"Claude batch API error: {e}")
+        return results
 
+    for entry in parsed if isinstance(parsed, list) else []:
+        index = entry.get('index') if isinstance(entry, dict) else None
+        analysis = validate_analysis(entry)
+        if analysis is None or not isinstance(index, int) or not 0 <= index < len(misses):
+            continue
+        i, cache_key = misses[index]
+        if results[i] is None:
+            results[i] = analysis
+            analysis_cache.put(cache_key, analysis)
+    return results
 
-def save_news_to_db(article: dict) -> None:
-    """뉴스를 DynamoDB에 저장"""
-    try:
-        table = dynamodb.Table(TABLE_NEWS)
-        news_id = f"news_{datetime.utcnow().strftime('%Y%m%d%H%M%S')}_{hash(article['url']) % 10000}"
 
-        item = {
-            'pk': news_id,
-            'id': news_id,
-            'title': article.get('title', ''),
-            'source': article.get('source', ''),
-            'category': article.get('category', 'science'),
-            'category_kr': NEWS_CATEGORIES.get(article.get('category', 'science'), '과학'),
-            'summary': article.get('summary', ''),
-            'ai_analysis': article.get('ai_analysis', ''),
-            'ai_comment': article.get('ai_comment', ''),
-            'ai_perspective': article.get('ai_perspective', 'Science'),
-            'original_url': article.get('url', ''),
-            'pub_date': article.get('pub_date', ''),
-            'status': 'published',
-            'created_at': datetime.utcnow().isoformat()
-        }
-        table.put_item(Item=item)
-    except Exception as e:
-        print(f"Error saving news: {e}")
+# 중복 판별 시 무시하는 추적용 쿼리 파라미터
+TRACKING_PARAMS = {'fbclid', 'gclid', 'ref', 'ref_src', 'cmpid', 'ocid'}
+
+
+def normalize_url(url: str) -> str:
+    """중복 판별용 URL 정규화 (scheme/host 소문자, fragment·추적 파라미터·끝 슬래시 제거)"""
+    from urllib.parse import urlsplit, urlunsplit, parse_qsl, urlencode
 
+    parts = urlsplit(url.strip())
+    query = [
+        (k, v) for k, v in parse_qsl(parts.query, keep_blank_values=True)
+        if not k.lower().startswith('utm_') and k.lower() not in TRACKING_PARAMS
+    ]
+    path = parts.path.rstrip('/') or '/'
+    return urlunsplit((parts.scheme.lower(), parts.netloc.lower(), path, urlencode(sorted(query)), ''))
+
+
+def news_id_for(url: str) -> str:
+    """정규화 URL의 SHA-256 기반 뉴스 ID (실행/프로세스와 무관하게 고정)"""
+    digest = hashlib.sha256(normalize_url(url).encode('utf-8')).hexdigest()
+    return f"news_{digest[:32]}"
+
+
+def find_existing_news_ids(news_ids: list) -> set:
+    """이미 저장된 뉴스 ID 조회 (BatchGetItem, 100개 단위)"""
+    existing = set()
+    for i in range(0, len(news_ids), 100):
+        request = {TABLE_NEWS: {
+            'Keys': [{'pk': news_id} for news_id in news_ids[i:i + 100]],
+            'ProjectionExpression': 'pk'
+        }}
+        for attempt in range(5):
+            response = get_dynamodb().batch_get_item(RequestItems=request)
+            existing.update(item['pk'] for item in response.get('Responses', {}).get(TABLE_NEWS, []))
+            request = response.get('UnprocessedKeys') or {}
+            if not request:
+                break
+            time.sleep(0.05 * (2 ** attempt))
+    return existing
+
+
+def build_news_item(article: dict) -> dict:
+    """수집/분석된 기사로 뉴스 항목 생성 (ID는 정규화 URL 해시)"""
+    news_id = news_id_for(article['url'])
+    return {
+        'pk': news_id,
+        'id': news_id,
+        'title': article.get('title', ''),
+        'source': article.get('source', ''),
+        'category': article.get('category', 'science'),
+        'category_kr': NEWS_CATEGORIES.get(article.get('category', 'science'), '과학'),
+        'summary': article.get('summary', ''),
+        'ai_analysis': article.get('ai_analysis', ''),
+        'ai_comment': article.get('ai_comment', ''),
+        'ai_perspective': article.get('ai_perspective', 'Science'),
+        'original_url': article.get('url', ''),
+        'pub_date': article.get('pub_date', ''),
+        'status': 'published',
+        'created_at': datetime.utcnow().isoformat(),
+        **news_index_attributes(article.get('category', 'science'), article.get('ai_perspective', 'Science'))
+    }
+
+
+def build_pending_news_item(article: dict) -> dict:
+    """분석 전 기사 항목 (status=pending, 분석 입력용 description 포함, 필터 GSI 키 없음)"""
+    item = build_news_item(article)
+    for key in news_index_attributes('', ''):
+        del item[key]
+    return {
+        **item,
+        'status': 'pending',
+        'description': article.get('description', ''),
+        'attempts': 0
+    }
 
-def handle_get_news_script() -> dict:
-    """유튜브 녹음용 대본 생성"""
+
+def handle_get_news_script(event: dict = None) -> dict:
+    """유튜브 녹음용 대본 생성 (category / perspective / since 필터로 주제별 브리핑)"""
     try:
-        # 최신 뉴스 가져오기
-        table = dynamodb.Table(TABLE_NEWS)
-        response = table.scan(
-            FilterExpression='#status = :published',
-            ExpressionAttributeNames={'#status': 'status'},
-            ExpressionAttributeValues={':published': 'published'}
-        )
-        news_list = response.get('Items', [])
-        news_list.sort(key=lambda x: x.get('created_at', ''), reverse=True)
-        news_list = news_list[:5]  # 최신 5개
+        filters = get_news_filters(event or {})
+    except ValueError as e:
+        return json_response(400, {'error': str(e)})
+
+    try:
+        # 최신 뉴스 5개 (필터가 있으면 해당 GSI 파티션에서)
+        news_list, _ = query_news(filters, limit=5)
     except:
-        news_list = get_sample_news()[:5]
+        news_list = filter_sample_news(filters)[:5]
 
     # 대본 생성
-    script = generate_news_script(news_list)
+    script = generate_news_script(news_list, news_theme(filters))
     return json_response(200, {
         'success': True,
         'script': script,
-        'news_count': len(news_list)
+        'news_count': len(news_list),
+        'filters': filters
     })
 
 
-def generate_news_script(news_list: list) -> dict:
-    """뉴스 대본 생성"""
+def news_theme(filters: dict) -> str:
+    """필터 조건의 대본용 주제 표시 (예: '경제 · Governance 관점')"""
+    parts = []
+    if filters.get('category'):
+        parts.append(NEWS_CATEGORIES[filters['category']])
+    if filters.get('perspective'):
+        parts.append(f"{filters['perspective']} 관점")
+    return ' · '.join(parts)
+
+
+def generate_news_script(news_list: list, theme: str = '') -> dict:
+    """뉴스 대본 생성 (theme이 있으면 주제별 브리핑으로 소개)"""
     today = datetime.utcnow().strftime('%Y년 %m월 %d일')
+    headline = f'오늘의 {theme} 주요 뉴스' if theme else '오늘의 주요 뉴스'
 
     # 인트로
     intro = f"""안녕하세요. AI 문명 관측소입니다.
-{today}, AI의 눈으로 바라본 오늘의 주요 뉴스를 전해드립니다.
+{today}, AI의 눈으로 바라본 {headline}를 전해드립니다.
 
 인간 세계에서 일어나는 변화들을 AI 관점에서 분석하고,
 문명적 전환의 의미를 함께 생각해보겠습니다."""
@@ -828,6 +3229,197 @@ def get_sample_news() -> list:
     ]
 
 
+# ==========================================
+# 검색 (문자 bigram 역색인)
+# ==========================================
+# aiatlas_search 테이블에 토큰별 게시 목록을 저장: PK token, SK "created_at#문서 ID" (최신순)
+# 한국어는 띄어쓰기가 검색어 경계와 맞지 않으므로 단어 안의 연속 두 글자(bigram)를 토큰으로 쓴다.
+# 검색어의 bigram이 모두 있는 문서를 후보로 모은 뒤, 원문에 검색어가 실제로 있는지 확인한다.
+
+SEARCH_FIELDS = {
+    'news': ('title', 'summary', 'ai_analysis'),
+    'event': ('title', 'what_changed', 'why_it_matters')
+}
+SEARCH_SOURCES = {
+    'news': (TABLE_NEWS, NEWS_STATUS_INDEX, 'created_at'),
+    'event': (TABLE_EVENTS, EVENTS_STATUS_INDEX, 'date')
+}
+SEARCH_MAX_TOKENS = 8           # 검색어에서 조회할 최대 토큰 수 (긴 단어 우선)
+SEARCH_POSTINGS_LIMIT = 1000    # 토큰당 읽는 최대 게시 수 (최신순)
+SEARCH_VERIFY_BATCH = 100       # 원문 확인 BatchGetItem 단위 (API 최대 100개)
+SEARCH_DEFAULT_LIMIT = 20
+SEARCH_MAX_LIMIT = 50
+SEARCH_CACHE_SIZE = 256         # 컨테이너당 보관하는 검색 결과 수
+_search_cache = OrderedDict()   # (검색어, type, limit) -> (콘텐츠 버전, 만료 시각, 응답)
+_WORD_PATTERN = re.compile(r'\w+')
+
+
+def search_words(text: str) -> list:
+    """NFKC 정규화 + 소문자 변환 후 단어 목록"""
+    return _WORD_PATTERN.findall(unicodedata.normalize('NFKC', text or '').lower())
+
+
+def word_tokens(word: str) -> list:
+    """단어의 문자 bigram (한 글자 단어는 색인하지 않음)"""
+    return [word[i:i + 2] for i in range(len(word) - 1)]
+
+
+def document_kind(doc_id: str) -> str:
+    """문서 ID로 종류 판별 (event_* / news_*)"""
+    return 'event' if doc_id.startswith('event_') else 'news'
+
+
+def posting_items(item: dict, kind: str) -> list:
+    """문서의 게시 항목 목록 (토큰마다 1개)"""
+    tokens = set()
+    for field in SEARCH_FIELDS[kind]:
+        for word in search_words(item.get(field, '')):
+            tokens.update(word_tokens(word))
+    sort_key = f"{item.get('created_at', '')}#{item['pk']}"
+    return [{'pk': token, 'sk': sort_key} for token in tokens]
+
+
+def update_search_index(items: list, kind: str, delete: bool = False) -> int:
+    """문서들의 게시 항목 저장/삭제 (BatchWriteItem, 실패는 로그만 남김)
+
+    반환: 처리하지 못한 게시 항목 수
+    """
+    postings = [posting for item in items for posting in posting_items(item, kind)]
+    if not postings:
+        return 0
+    try:
+        result = batch_write_items(TABLE_SEARCH, postings, delete=delete, key_attributes=('pk', 'sk'))
+    except Exception as e:
+        print(f"Error updating search index: {e}")
+        return len(postings)
+    if result['failed']:
+        print(f"Search index: {len(result['failed'])} postings not written")
+    return len(result['failed'])
+
+
+def rebuild_search_index() -> dict:
+    """게시된 뉴스/이벤트 전체 색인 (테이블 생성 직후, 대량 입력 후)
+
+    반환: {종류: {'documents': 문서 수, 'failed_postings': 실패한 게시 항목 수}}
+    """
+    counts = {}
+    for kind, (table_name, index_name, sort_key) in SEARCH_SOURCES.items():
+        items, _ = query_published(get_table(table_name), index_name, sort_key)
+        counts[kind] = {'documents': len(items), 'failed_postings': update_search_index(items, kind)}
+    return counts
+
+
+def handle_search(event: dict) -> dict:
+    """뉴스/이벤트 전문 검색 (q, type=news|event, limit) - 최신순"""
+    params = event.get('queryStringParameters') or {}
+    query = (params.get('q') or '').strip()
+    kind = params.get('type') or ''
+    if kind and kind not in SEARCH_FIELDS:
+        return json_response(400, {'error': 'Invalid type'})
+    try:
+        limit = max(1, min(int(params.get('limit') or SEARCH_DEFAULT_LIMIT), SEARCH_MAX_LIMIT))
+    except ValueError:
+        return json_response(400, {'error': 'Invalid limit'})
+    words = [word for word in search_words(query) if len(word) >= 2]
+    if not words:
+        return json_response(400, {'error': 'q must contain a word of at least 2 characters'})
+
+    # 공개 조회 응답 캐시와 같은 규칙 (콘텐츠 버전 + TTL), 검색어 종류가 많으므로 LRU로 크기 제한
+    version = get_content_version()
+    key = (' '.join(words), kind, limit)
+    entry = _search_cache.get(key)
+    if version is not None and entry and entry[0] == version and entry[1] > time.monotonic():
+        _search_cache.move_to_end(key)
+        response = entry[2]
+    else:
+        try:
+            results = search_documents(words, kind, limit)
+        except Exception as e:
+            print(f"Error searching '{query}': {e}")
+            return json_response(500, {'error': str(e)})
+        response = json_response(200, {'success': True, 'query': query, 'results': results, 'count': len(results)})
+        if version is not None:
+            _search_cache[key] = (version, time.monotonic() + RESPONSE_CACHE_TTL, response)
+            _search_cache.move_to_end(key)
+            if len(_search_cache) > SEARCH_CACHE_SIZE:
+                _search_cache.popitem(last=False)
+    return {**response, 'headers': dict(response['headers'])}
+
+
+def search_documents(words: list, kind: str, limit: int) -> list:
+    """검색어 단어가 모두 들어 있는 게시 문서를 최신순으로 limit개까지 조회"""
+    tokens = []
+    for word in sorted(words, key=len, reverse=True):
+        for token in word_tokens(word):
+            if token not in tokens:
+                tokens.append(token)
+    table = get_table(TABLE_SEARCH)
+
+    # 1단계: 토큰마다 원문 확인 한 번 분량만 읽어, 그 안에 끝나는 드문 토큰들의 교집합을 후보로 사용
+    # 2단계: 모두 흔한 토큰이면 1단계 게시가 가장 오래전까지 퍼진 (가장 덜 흔한) 토큰의
+    #        최신 SEARCH_POSTINGS_LIMIT개를 후보로 사용 (더 흔한 토큰은 이보다 좁혀 주지 못함)
+    probes = [(token, *read_postings(table, token, SEARCH_VERIFY_BATCH)) for token in tokens[:SEARCH_MAX_TOKENS]]
+    rare = [found for _, found, complete in probes if complete]
+    if rare:
+        candidates = set.intersection(*rare)
+    else:
+        sparsest = min(probes, key=lambda probe: min(probe[1]))[0]
+        candidates, _ = read_postings(table, sparsest, SEARCH_POSTINGS_LIMIT)
+
+    doc_ids = [sort_key.rsplit('#', 1)[1] for sort_key in sorted(candidates, reverse=True)]
+    if kind:
+        doc_ids = [doc_id for doc_id in doc_ids if document_kind(doc_id) == kind]
+
+    # bigram만 겹치고 검색어는 없는 문서를 걸러내기 위해 원문 확인
+    results = []
+    for i in range(0, len(doc_ids), SEARCH_VERIFY_BATCH):
+        for doc_id, item in fetch_documents(doc_ids[i:i + SEARCH_VERIFY_BATCH]):
+            doc_kind = document_kind(doc_id)
+            if item.get('status') != 'published':
+                continue
+            text = ' '.join(' '.join(search_words(item.get(field, ''))) for field in SEARCH_FIELDS[doc_kind])
+            if all(word in text for word in words):
+                results.append({'type': doc_kind, **item})
+                if len(results) >= limit:
+                    return results
+    return results
+
+
+def read_postings(table, token: str, limit: int) -> tuple:
+    """토큰의 게시 목록을 최신순으로 limit개까지 조회
+
+    반환: (SK 집합, 끝까지 읽었는지 여부)
+    """
+    postings, last_key = read_pages(table.query, {
+        'KeyConditionExpression': 'pk = :token',
+        'ExpressionAttributeValues': {':token': token},
+        'ScanIndexForward': False
+    }, limit)
+    return {posting['sk'] for posting in postings}, not last_key
+
+
+def fetch_documents(doc_ids: list) -> list:
+    """문서 ID 목록을 BatchGetItem으로 조회 (입력 순서 유지, 없는 문서 제외)
+
+    반환: [(doc_id, item), ...]
+    """
+    request = {}
+    for doc_id in doc_ids:
+        table_name = SEARCH_SOURCES[document_kind(doc_id)][0]
+        request.setdefault(table_name, {'Keys': []})['Keys'].append({'pk': doc_id})
+
+    found = {}
+    for attempt in range(BATCH_WRITE_MAX_ATTEMPTS):
+        response = get_dynamodb().batch_get_item(RequestItems=request)
+        for items in response.get('Responses', {}).values():
+            found.update((item['pk'], item) for item in items)
+        request = response.get('UnprocessedKeys') or {}
+        if not request:
+            break
+        time.sleep(BATCH_WRITE_BACKOFF * (2 ** attempt))
+    return [(doc_id, found[doc_id]) for doc_id in doc_ids if doc_id in found]
+
+
 # ==========================================
 # Status API
 # ==========================================
@@ -848,102 +3440,302 @@ def handle_get_status(event: dict) -> dict:
     })
 
 
+# ==========================================
+# Static Snapshot
+# ==========================================
+
+# 스냅샷으로 내보낼 공개 엔드포인트 -> 응답 생성 함수
+SNAPSHOT_ENDPOINTS = {
+    '/news/latest': lambda: handle_get_news_latest(),
+    '/timeline': lambda: handle_get_events_public({}),
+    '/roadmaps': lambda: handle_get_roadmaps({}),
+    '/outlook': lambda: handle_get_outlook({}),
+    '/governance': lambda: handle_get_governance({}),
+    '/irreversibles': lambda: handle_get_irreversibles({})
+}
+
+
+def build_static_snapshot(output_dir: str) -> dict:
+    """공개 API 응답을 기존 핸들러로 렌더링해 output_dir에 버전별 JSON 파일로 저장
+
+    파일명에 내용 해시를 넣고(news-latest.<hash>.json) gzip/brotli 압축본을 함께
+    쓴 뒤, 마지막에 엔드포인트 -> 파일 매핑인 manifest.json을 갱신한다.
+    이전 버전 파일은 삭제한다.
+    """
+    import gzip
+    try:
+        import brotli
+    except ImportError:
+        brotli = None
+
+    os.makedirs(output_dir, exist_ok=True)
+    files = {}
+    for endpoint, render in SNAPSHOT_ENDPOINTS.items():
+        response = render()
+        if response['statusCode'] != 200:
+            print(f"Snapshot skipped {endpoint}: {response['statusCode']}")
+            continue
+        data = response['body'].encode('utf-8')
+        name = endpoint.strip('/').replace('/', '-')
+        filename = f"{name}.{hashlib.sha256(data).hexdigest()[:12]}.json"
+        variants = {filename: data, filename + '.gz': gzip.compress(data, mtime=0)}
+        if brotli is not None:
+            variants[filename + '.br'] = brotli.compress(data)
+        for variant, content in variants.items():
+            with open(os.path.join(output_dir, variant), 'wb') as f:
+                f.write(content)
+        files[endpoint] = filename
+
+    # generated_at은 프론트엔드가 스냅샷 유효 기간을 판단하는 기준 (UTC, Z 표기)
+    manifest = {'generated_at': datetime.utcnow().isoformat() + 'Z', 'files': files}
+    tmp_path = os.path.join(output_dir, 'manifest.json.tmp')
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        json.dump(manifest, f, ensure_ascii=False, indent=2)
+    os.replace(tmp_path, os.path.join(output_dir, 'manifest.json'))
+
+    # 매니페스트에 없는 이전 버전 정리
+    current = set(files.values())
+    prefixes = tuple(endpoint.strip('/').replace('/', '-') + '.' for endpoint in SNAPSHOT_ENDPOINTS)
+    for existing in os.listdir(output_dir):
+        base = existing[:-3] if existing.endswith(('.gz', '.br')) else existing
+        if existing.startswith(prefixes) and base not in current:
+            os.remove(os.path.join(output_dir, existing))
+    return manifest
+
+
+# ==========================================
+# 라우팅
+# ==========================================
+
+# API Gateway 경로 prefix (기존 경로, 새 경로 gendao 없이) - 경로 맨 앞에서만 제거
+API_PREFIXES = ('/v1/gendao/aiatlas', '/v1/aiatlas')
+
+# 캐시 불가 라우트 응답에 붙는 기본 Cache-Control
+NO_STORE_CACHE_CONTROL = 'no-store'
+
+# (메서드, 경로, 처리 함수, 옵션)
+#   처리 함수는 req = {'event', 'body', 'context', 'params'}를 받는다.
+#   경로의 {name} 세그먼트는 req['params'][name]으로 전달된다.
+#   옵션: auth - 관리자 토큰 필요, cacheable - False면 Cache-Control: no-store 부여
+ROUTES = [
+    ('GET', '/health', lambda req: handle_health(), {}),
+    ('POST', '/auth/login', lambda req: handle_login(req['body']), {}),
+
+    ('GET', '/config', lambda req: handle_get_config(req['event']), {'auth': True}),
+    ('PUT', '/config', lambda req: handle_update_config(req['body'], req['event']), {'auth': True}),
+
+    ('GET', '/events/public', lambda req: handle_get_events_public(req['event']), {'cacheable': True}),
+    ('GET', '/timeline', lambda req: handle_get_events_public(req['event']), {'cacheable': True}),
+    ('GET', '/events', lambda req: handle_get_events(req['event']), {'auth': True}),
+    ('POST', '/events', lambda req: handle_create_event(req['body'], req['event']), {'auth': True}),
+    ('POST', '/events/import', lambda req: handle_import_events(req['body'], req['event']), {'auth': True}),
+    ('DELETE', '/events/{id}', lambda req: handle_delete_event(req['params']['id'], req['event']), {'auth': True}),
+
+    ('GET', '/roadmaps', lambda req: handle_get_roadmaps(req['event']), {'cacheable': True}),
+    ('GET', '/irreversibles', lambda req: handle_get_irreversibles(req['event']), {'cacheable': True}),
+    ('GET', '/outlook', lambda req: handle_get_outlook(req['event']), {'cacheable': True}),
+    ('GET', '/governance', lambda req: handle_get_governance(req['event']), {'cacheable': True}),
+    ('GET', '/status', lambda req: handle_get_status(req['event']), {'auth': True}),
+
+    ('GET', '/news/latest', lambda req: handle_get_news_latest(), {'cacheable': True}),
+    ('GET', '/news', lambda req: handle_get_news(req['event']), {'cacheable': True}),
+    ('GET', '/news/script', lambda req: handle_get_news_script(req['event']), {'cacheable': True}),
+    ('GET', '/search', lambda req: handle_search(req['event']), {'cacheable': True}),
+    # EventBridge 스케줄 호출은 토큰 없이 허용 -> 인증은 핸들러에서 확인
+    ('POST', '/news/collect', lambda req: handle_collect_news(req['event'], req['context']), {}),
+    ('POST', '/news/analyze', lambda req: handle_analyze_news(req['event'], req['context']), {}),
+
+    ('POST', '/materialized/rebuild', lambda req: handle_rebuild_materialized(req['event']), {'auth': True}),
+]
+
+
+def build_router(routes: list) -> dict:
+    """라우트 목록을 고정 경로 dict + 경로 파라미터 트라이로 컴파일
+
+    반환: {'static': {path: {method: route}}, 'trie': 노드}
+    노드: {'children': {세그먼트: 노드}, 'param': (이름, 노드) | None, 'methods': {method: route}}
+    """
+    def new_node():
+        return {'children': {}, 'param': None, 'methods': {}}
+
+    router = {'static': {}, 'trie': new_node()}
+    for method, path, fn, options in routes:
+        route = {
+            'method': method,
+            'path': path,
+            'handler': fn,
+            'auth': options.get('auth', False),
+            'cacheable': options.get('cacheable', False)
+        }
+        segments = path.strip('/').split('/')
+        if not any(seg.startswith('{') for seg in segments):
+            methods = router['static'].setdefault(path, {})
+        else:
+            node = router['trie']
+            for seg in segments:
+                if seg.startswith('{') and seg.endswith('}'):
+                    name = seg[1:-1]
+                    if node['param'] is None:
+                        node['param'] = (name, new_node())
+                    elif node['param'][0] != name:
+                        raise ValueError(f'Conflicting path parameter in {path}')
+                    node = node['param'][1]
+                else:
+                    node = node['children'].setdefault(seg, new_node())
+            methods = node['methods']
+        if method in methods:
+            raise ValueError(f'Duplicate route: {method} {path}')
+        methods[method] = route
+    return router
+
+
+def match_route(router: dict, path: str) -> tuple:
+    """경로에 등록된 메서드별 라우트와 경로 파라미터 조회
+
+    반환: ({method: route}, params) - 경로가 없으면 ({}, {})
+    고정 경로가 파라미터 경로보다 우선한다 (/events/import vs /events/{id}).
+    """
+    methods = router['static'].get(path)
+    if methods:
+        return methods, {}
+
+    node, params = router['trie'], {}
+    for seg in path.strip('/').split('/'):
+        child = node['children'].get(seg)
+        if child is not None:
+            node = child
+        elif node['param'] is not None and seg:
+            name, node = node['param']
+            params[name] = unquote(seg)
+        else:
+            return {}, {}
+    return node['methods'], params
+
+
+def normalize_path(path: str) -> str:
+    """API Gateway prefix와 끝 슬래시 제거"""
+    for prefix in API_PREFIXES:
+        if path == prefix or path.startswith(prefix + '/'):
+            path = path[len(prefix):]
+            break
+    return path.rstrip('/') or '/'
+
+
+ROUTER = build_router(ROUTES)
+
+
 # ==========================================
 # Main Handler
 # ==========================================
 
 def handler(event: dict, context) -> dict:
-    """Lambda 핸들러"""
+    """Lambda 핸들러 (요청 지표 수집 후 EMF 로그 출력)"""
+    metrics_begin()
+    response = None
+    try:
+        response = compress_response(dispatch(event, context), event)
+        return response
+    finally:
+        metrics_end(response)
+        report_init_timing()
+
+
+def parse_body(event: dict) -> dict:
+    """요청 본문 JSON 파싱 (본문이 없으면 빈 dict, 잘못된 JSON이면 ValueError)
+
+    REST API 바이너리 미디어 유형에 */*가 있으면 본문이 base64로 인코딩되어 isBase64Encoded=true로 온다.
+    """
+    raw = event.get('body')
+    if not raw:
+        return {}
+    try:
+        if event.get('isBase64Encoded'):
+            raw = base64.b64decode(raw).decode('utf-8')
+        body = json.loads(raw) if raw.strip() else {}
+    except ValueError:
+        # binascii.Error, UnicodeDecodeError, JSONDecodeError 모두 ValueError
+        raise ValueError('Invalid JSON body')
+    if not isinstance(body, dict):
+        raise ValueError('Request body must be a JSON object')
+    return body
+
+
+def dispatch(event: dict, context) -> dict:
+    """라우트 조회 후 처리 함수 호출"""
     method = event.get('httpMethod', 'GET')
-    path = event.get('path', '')
-
-    # OPTIONS 처리 (CORS)
-    if method == 'OPTIONS':
-        return json_response(200, {'message': 'OK'})
-
-    # 경로 정규화 - 다양한 prefix 지원
-    path = path.replace('/v1/gendao/aiatlas', '')  # 기존 경로
-    path = path.replace('/v1/aiatlas', '')          # 새 경로 (gendao 없이)
-    path = path.rstrip('/')
-    if not path:
-        path = '/'
-
-    # Body 파싱
-    body = {}
-    if event.get('body'):
-        try:
-            body = json.loads(event['body'])
-        except:
-            pass
+    path = normalize_path(event.get('path', ''))
 
-    # 라우팅
-    try:
-        # Health
-        if path == '/health' and method == 'GET':
-            return handle_health()
-
-        # Auth
-        if path == '/auth/login' and method == 'POST':
-            return handle_login(body)
-
-        # Config
-        if path == '/config' and method == 'GET':
-            return handle_get_config(event)
-        if path == '/config' and method == 'PUT':
-            return handle_update_config(body, event)
-
-        # Events
-        if path == '/events/public' and method == 'GET':
-            return handle_get_events_public()
-        if path == '/events' and method == 'GET':
-            return handle_get_events(event)
-        if path == '/events' and method == 'POST':
-            return handle_create_event(body, event)
-        if path.startswith('/events/') and method == 'DELETE':
-            event_id = path.split('/')[-1]
-            return handle_delete_event(event_id, event)
-
-        # Roadmaps
-        if path == '/roadmaps' and method == 'GET':
-            return handle_get_roadmaps()
-
-        # Irreversibles
-        if path == '/irreversibles' and method == 'GET':
-            return handle_get_irreversibles()
-
-        # Outlook
-        if path == '/outlook' and method == 'GET':
-            return handle_get_outlook()
-
-        # Governance
-        if path == '/governance' and method == 'GET':
-            return handle_get_governance()
-
-        # Status
-        if path == '/status' and method == 'GET':
-            return handle_get_status(event)
-
-        # Timeline (alias for events/public)
-        if path == '/timeline' and method == 'GET':
-            return handle_get_events_public()
-
-        # News
-        if path == '/news/latest' and method == 'GET':
-            return handle_get_news_latest()
-        if path == '/news' and method == 'GET':
-            return handle_get_news()
-        if path == '/news/collect' and method == 'POST':
-            return handle_collect_news(event)
-        if path == '/news/script' and method == 'GET':
-            return handle_get_news_script()
-
-        # 404
-        return json_response(404, {'error': 'Not found', 'path': path})
+    try:
+        methods, params = match_route(ROUTER, path)
+        if not methods:
+            return json_response(404, {'error': 'Not found', 'path': path})
+
+        allowed = ','.join(sorted(methods) + ['OPTIONS'])
+
+        # OPTIONS 처리 (CORS) - 라우트에 등록된 메서드만 허용
+        if method == 'OPTIONS':
+            response = json_response(200, {'message': 'OK'})
+            response['headers']['Access-Control-Allow-Methods'] = allowed
+            return response
+
+        route = methods.get(method)
+        set_metric_property('Route', f"{method} {route['path']}" if route else 'unmatched')
+        if route is None:
+            response = json_response(405, {'error': 'Method not allowed', 'path': path})
+            response['headers']['Allow'] = allowed
+            return response
+
+        if route['auth'] and not verify_auth(event):
+            response = json_response(401, {'error': 'Unauthorized'})
+        else:
+            try:
+                body = parse_body(event)
+            except ValueError as e:
+                return json_response(400, {'error': str(e)})
+
+            response = route['handler']({'event': event, 'body': body, 'context': context, 'params': params})
+
+        if not route['cacheable']:
+            response['headers'].setdefault('Cache-Control', NO_STORE_CACHE_CONTROL)
+        return response
 
     except Exception as e:
         return json_response(500, {'error': str(e)})
 
 
-# Lambda 진입점
+# Lambda 진입점 (분석 작업자 비동기 호출은 worker_handler로)
 def lambda_handler(event, context):
+    if event.get('source') == 'aiatlas.worker':
+        return worker_handler(event, context)
     return handler(event, context)
+
+
+# 모듈 import 완료 (정적 응답 직렬화 포함)
+_init_spans['module_import'] = round((time.perf_counter() - _MODULE_LOAD_STARTED) * 1000, 2)
+
+
+if __name__ == '__main__':
+    # 로컬/CI 명령
+    #   python handlers/aiatlas_handler.py snapshot [출력 경로]  - 정적 스냅샷 생성
+    #   python handlers/aiatlas_handler.py rebuild               - 구체화 항목 재생성
+    #   python handlers/aiatlas_handler.py backfill-news-index   - 기존 게시 뉴스에 필터 GSI 키 추가
+    #   python handlers/aiatlas_handler.py rebuild-search        - 게시된 뉴스/이벤트 전체 검색 색인
+    import sys
+
+    if len(sys.argv) >= 2 and sys.argv[1] == 'snapshot':
+        output = sys.argv[2] if len(sys.argv) > 2 else os.path.join(
+            os.path.dirname(os.path.abspath(__file__)), '..', 'dist', 'api'
+        )
+        print(json.dumps(build_static_snapshot(output), ensure_ascii=False, indent=2))
+    elif len(sys.argv) >= 2 and sys.argv[1] == 'rebuild':
+        # 대량 입력/삭제 후 최신 N개 구체화 항목 재생성
+        for view_key in MATERIALIZED_VIEWS:
+            print(f"{view_key}: {len(rebuild_materialized(view_key))} items")
+        bump_content_version()
+    elif len(sys.argv) >= 2 and sys.argv[1] == 'backfill-news-index':
+        print(f"{backfill_news_index()} news items updated")
+    elif len(sys.argv) >= 2 and sys.argv[1] == 'rebuild-search':
+        print(json.dumps(rebuild_search_index()))
+        bump_content_version()
+    else:
+        print('usage: aiatlas_handler.py snapshot [output_dir] | rebuild | backfill-news-index | rebuild-search')